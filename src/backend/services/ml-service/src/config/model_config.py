@@ -8,13 +8,33 @@ Version: 1.0.0
 """
 
 import os
-from typing import Dict, Optional, List, Union, Any
+import json
+import functools
+from types import MappingProxyType
+from typing import Dict, Optional, List, Union, Any, Mapping
 import yaml  # version: 6.0+
 
+# Prefer the libyaml-backed C emitter/parser; fall back to pure Python when
+# PyYAML was built without libyaml bindings
+try:
+    from yaml import CSafeDumper as YamlDumper, CSafeLoader as YamlLoader
+except ImportError:  # pragma: no cover - depends on PyYAML build
+    from yaml import SafeDumper as YamlDumper, SafeLoader as YamlLoader
+
 # Global Constants
 MODEL_BASE_PATH = os.getenv('MODEL_BASE_PATH', '/opt/ml/models')
 DEFAULT_SCORING_THRESHOLD = 0.65
 CONFIG_VERSION = '1.0.0'
+CONFIG_CACHE_SIZE = 64
+MODEL_PATH_CACHE_SIZE = 32
+
+REQUIRED_CONFIG_KEYS = frozenset({
+    'numerical_features',
+    'categorical_features',
+    'text_features',
+    'feature_weights',
+    'preprocessing'
+})
 
 # Feature Configuration for Different Insurance Verticals
 FEATURE_CONFIG = {
@@ -47,12 +67,100 @@ FEATURE_CONFIG = {
     }
 }
 
+def _config_file_path(vertical: str) -> str:
+    """Location of the persisted configuration for a vertical."""
+    return os.path.join(MODEL_BASE_PATH, vertical, 'config.yaml')
+
+def _config_file_mtime(vertical: str) -> int:
+    """Modification time of the persisted configuration, 0 when absent."""
+    try:
+        return os.stat(_config_file_path(vertical)).st_mtime_ns
+    except OSError:
+        return 0
+
+def _check_override_keys(vertical: str, config: Mapping) -> None:
+    """Reject configuration keys not defined for the vertical."""
+    invalid_keys = set(config.keys()) - set(FEATURE_CONFIG[vertical].keys())
+
+    if invalid_keys:
+        raise ValueError(f"Invalid configuration keys: {invalid_keys}")
+
+def _check_required_keys(config: Mapping) -> None:
+    """Ensure all required configuration keys are present and well-typed."""
+    if not all(key in config for key in REQUIRED_CONFIG_KEYS):
+        raise ValueError("Missing required configuration keys")
+
+    if not all(isinstance(config[key], (list, dict)) for key in REQUIRED_CONFIG_KEYS):
+        raise ValueError("Invalid configuration value types")
+
+@functools.lru_cache(maxsize=CONFIG_CACHE_SIZE)
+def _build_config(vertical: str, override_key: str, mtime: int) -> Mapping[str, Any]:
+    """
+    Build and validate the effective configuration for a vertical.
+
+    Results are memoized on the canonical override JSON and the persisted
+    configuration's mtime, so identical configurations are only merged and
+    validated once per process. The returned mapping is read-only and shared.
+
+    Args:
+        vertical (str): Insurance vertical (auto, home, etc.)
+        override_key (str): Canonical JSON of the configuration override
+        mtime (int): Persisted configuration mtime in nanoseconds, 0 if absent
+
+    Returns:
+        Mapping[str, Any]: Read-only validated configuration
+
+    Raises:
+        ValueError: If the resulting configuration is invalid
+    """
+    config = FEATURE_CONFIG[vertical].copy()
+
+    # Apply persisted configuration written by update_config(persist=True)
+    if mtime:
+        with open(_config_file_path(vertical)) as f:
+            persisted = yaml.load(f, Loader=YamlLoader) or {}
+        persisted_config = persisted.get('config') or {}
+        _check_override_keys(vertical, persisted_config)
+        config.update(persisted_config)
+
+    # Apply configuration override if provided
+    override = json.loads(override_key)
+    if override:
+        _check_override_keys(vertical, override)
+        config.update(override)
+
+    _check_required_keys(config)
+
+    return MappingProxyType(config)
+
+@functools.lru_cache(maxsize=MODEL_PATH_CACHE_SIZE)
+def _validated_path(path: str) -> str:
+    """
+    Check that a model path exists, remembering positive results.
+
+    Missing paths raise and are therefore not cached, so they are re-checked
+    on the next call.
+
+    Raises:
+        FileNotFoundError: If model path does not exist
+    """
+    if not os.path.exists(path):
+        raise FileNotFoundError(f"Model path does not exist: {path}")
+        
+    return path
+
+def clear_model_path_cache() -> None:
+    """Forget validated model paths so they are re-checked, e.g. after a deploy."""
+    _validated_path.cache_clear()
+
 class ModelConfig:
     """
     Configuration manager for ML models providing versioned access to model paths,
     parameters, thresholds, and feature settings with caching support.
     """
     
+    __slots__ = ('_vertical', '_config', '_cache', '_version')
+    
     def __init__(
         self,
         vertical: str,
@@ -74,17 +182,12 @@ class ModelConfig:
             raise ValueError(f"Unsupported insurance vertical: {vertical}")
             
         self._vertical = vertical
-        self._config = FEATURE_CONFIG[vertical].copy()
         self._cache = {} if enable_caching else None
-        self._version = float(CONFIG_VERSION)
+        self._version = float(CONFIG_VERSION.rsplit('.', 1)[0])  # major.minor
         
-        # Apply configuration override if provided
-        if config_override:
-            self._validate_config_override(config_override)
-            self._config.update(config_override)
-            
-        # Validate configuration completeness
-        self._validate_configuration()
+        # Resolve validated configuration from the process-wide cache
+        override_key = json.dumps(config_override or {}, sort_keys=True)
+        self._config = _build_config(vertical, override_key, _config_file_mtime(vertical))
 
     def get_model_path(self, model_version: Optional[str] = None) -> str:
         """
@@ -99,12 +202,6 @@ class ModelConfig:
         Raises:
             FileNotFoundError: If model path does not exist
         """
-        cache_key = f"model_path_{model_version}"
-        
-        # Check cache first
-        if self._cache is not None and cache_key in self._cache:
-            return self._cache[cache_key]
-            
         # Construct base path
         base_path = os.path.join(MODEL_BASE_PATH, self._vertical)
         
@@ -112,15 +209,8 @@ class ModelConfig:
         if model_version:
             base_path = os.path.join(base_path, f"v{model_version}")
             
-        # Validate path exists
-        if not os.path.exists(base_path):
-            raise FileNotFoundError(f"Model path does not exist: {base_path}")
-            
-        # Cache result if enabled
-        if self._cache is not None:
-            self._cache[cache_key] = base_path
-            
-        return base_path
+        # Validate path exists, positive results are cached process-wide
+        return _validated_path(base_path)
 
     def get_scoring_threshold(self) -> float:
         """
@@ -151,6 +241,44 @@ class ModelConfig:
             
         return threshold
 
+    def get_market_adjustments(self) -> Dict[str, float]:
+        """
+        Get the market adjustment multipliers applied to high-confidence scores.
+        
+        Returns:
+            Dict[str, float]: Multiplier per market factor, empty when none are configured
+            
+        Raises:
+            ValueError: If a multiplier is not numeric
+        """
+        adjustments = self._config.get('market_adjustments', {})
+        
+        try:
+            return {factor: float(value) for factor, value in adjustments.items()}
+        except (TypeError, ValueError):
+            raise ValueError(f"Invalid market adjustments: {adjustments}")
+
+    def get_feature_config(self) -> Mapping[str, Any]:
+        """
+        Get the feature configuration for the vertical.
+        
+        Returns:
+            Mapping[str, Any]: Feature lists, weights and preprocessing settings
+        """
+        return self._config
+
+    def get_cache_config(self) -> Dict[str, Any]:
+        """
+        Get the feature caching configuration for the vertical.
+        
+        Returns:
+            Dict[str, Any]: Cache settings, empty when caching is disabled
+        """
+        if self._cache is None:
+            return {}
+            
+        return dict(self._config.get('cache', {'enable_cache': True}))
+
     def update_config(self, new_config: Dict[str, Any], persist: bool = False) -> bool:
         """
         Update configuration settings with validation.
@@ -172,8 +300,8 @@ class ModelConfig:
         old_config = self._config.copy()
         
         try:
-            # Update configuration
-            self._config.update(new_config)
+            # Update configuration (copy-on-write, cached configs are shared)
+            self._config = {**self._config, **new_config}
             
             # Increment version
             self._version += 0.1
@@ -185,6 +313,7 @@ class ModelConfig:
             # Persist changes if requested
             if persist:
                 self._persist_configuration()
+                _build_config.cache_clear()
                 
             return True
             
@@ -200,19 +329,7 @@ class ModelConfig:
         Raises:
             ValueError: If configuration is invalid
         """
-        required_keys = {
-            'numerical_features',
-            'categorical_features',
-            'text_features',
-            'feature_weights',
-            'preprocessing'
-        }
-        
-        if not all(key in self._config for key in required_keys):
-            raise ValueError("Missing required configuration keys")
-            
-        if not all(isinstance(self._config[key], (list, dict)) for key in required_keys):
-            raise ValueError("Invalid configuration value types")
+        _check_required_keys(self._config)
 
     def _validate_config_override(self, config: Dict) -> None:
         """
@@ -224,11 +341,7 @@ class ModelConfig:
         Raises:
             ValueError: If configuration override is invalid
         """
-        allowed_keys = set(FEATURE_CONFIG[self._vertical].keys())
-        invalid_keys = set(config.keys()) - allowed_keys
-        
-        if invalid_keys:
-            raise ValueError(f"Invalid configuration keys: {invalid_keys}")
+        _check_override_keys(self._vertical, config)
 
     def _persist_configuration(self) -> None:
         """
@@ -237,13 +350,33 @@ class ModelConfig:
         Raises:
             IOError: If configuration cannot be persisted
         """
-        config_path = os.path.join(MODEL_BASE_PATH, self._vertical, 'config.yaml')
+        config_path = _config_file_path(self._vertical)
         
         try:
             with open(config_path, 'w') as f:
                 yaml.dump({
                     'version': self._version,
-                    'config': self._config
-                }, f)
+                    'config': dict(self._config)
+                }, f, Dumper=YamlDumper)
         except Exception as e:
-            raise IOError(f"Failed to persist configuration: {str(e)}")
\ No newline at end of file
+            raise IOError(f"Failed to persist configuration: {str(e)}")
+
+@functools.lru_cache(maxsize=CONFIG_CACHE_SIZE)
+def load_config(vertical: str) -> ModelConfig:
+    """
+    Get the shared default configuration for a vertical.
+
+    Instances are memoized per vertical so services and feature pipelines do
+    not rebuild them. Call load_config.cache_clear() to pick up persisted
+    configuration changes.
+
+    Args:
+        vertical (str): Insurance vertical (auto, home, etc.)
+
+    Returns:
+        ModelConfig: Shared configuration for the vertical
+
+    Raises:
+        ValueError: If vertical is not supported or configuration is invalid
+    """
+    return ModelConfig(vertical)
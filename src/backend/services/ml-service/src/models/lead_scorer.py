@@ -8,19 +8,25 @@ Version: 1.0.0
 """
 
 import numpy as np  # version: 1.24+
-import pandas as pd  # version: 2.0+
 import joblib  # version: 1.3+
 import lightgbm as lgb  # version: 4.0+
 from prometheus_client import Counter, Histogram, Gauge  # version: 0.17+
-from typing import Dict, Tuple, Optional
+from typing import Callable, Dict, List, Mapping, Tuple, Optional, Union
+from types import MappingProxyType
+import functools
+import os
 import time
-from datetime import datetime
 
 from ..config.model_config import ModelConfig
 from ..utils.feature_engineering import FeatureEngineer
+from ..utils.scoring_math import price_and_confidence, batch_price_and_confidence
+from .onnx_model import ONNX_AVAILABLE, OnnxModel, onnx_model_path
+
+# Served model, an ONNX Runtime session when an export is available
+Model = Union[lgb.Booster, OnnxModel]
 
 # Global model cache to avoid reloading
-MODEL_CACHE: Dict[str, Tuple[lgb.Booster, float]] = {}
+MODEL_CACHE: Dict[str, Tuple[Model, float]] = {}
 
 # Vertical-specific price multipliers
 PRICE_MULTIPLIERS = {
@@ -47,16 +53,116 @@ PERFORMANCE_THRESHOLDS = {
     'score_threshold': 0.7
 }
 
+# Threads per prediction call; concurrency comes from workers and batching
+PREDICT_NUM_THREADS = int(os.getenv('ML_PREDICT_THREADS', '1'))
+
+# Version reported for models saved without a 'version' parameter
+DEFAULT_MODEL_VERSION = '1.0'
+
+# Months receiving a seasonal price boost
+SEASONAL_MONTHS = frozenset({1, 4, 7, 10})
+
 # Prometheus metrics
 SCORING_LATENCY = Histogram('lead_scoring_latency_ms', 'Lead scoring latency in milliseconds')
 ACCEPTANCE_RATE = Gauge('lead_acceptance_rate', 'Lead acceptance rate')
 SCORING_ERRORS = Counter('lead_scoring_errors_total', 'Total lead scoring errors')
 
+def _time_parts(timestamp: float) -> Tuple[int, int, int]:
+    """
+    Local hour, weekday (Monday is 0) and month for a Unix timestamp.
+
+    Reads the broken-down struct_time directly instead of allocating a
+    datetime; DST-correct since it goes through the C library's localtime.
+    """
+    parts = time.localtime(timestamp)
+    return parts.tm_hour, parts.tm_wday, parts.tm_mon
+
+@functools.lru_cache(maxsize=2)
+def _market_state(minute_key: int) -> Tuple[Mapping[str, bool], float, float]:
+    """
+    Market conditions and derived price factors for a given minute.
+
+    Conditions only change on minute boundaries, so the result is cached per
+    minute instead of being recomputed on every scoring request.
+
+    Args:
+        minute_key (int): Minutes since the epoch
+
+    Returns:
+        Tuple[Mapping[str, bool], float, float]: Read-only market conditions,
+        combined market adjustment multiplier and seasonal factor
+    """
+    hour, day, month = _time_parts(minute_key * 60)
+    
+    conditions = {}
+    
+    # Peak hours (9AM-5PM weekdays)
+    if 9 <= hour <= 17 and day < 5:
+        conditions['peak_hours'] = True
+    else:
+        conditions['off_peak'] = True
+        
+    # Weekend adjustment
+    if day >= 5:
+        conditions['weekend'] = True
+    
+    # Combine all applicable adjustments into a single factor
+    market_multiplier = 1.0
+    for condition in conditions:
+        market_multiplier *= MARKET_ADJUSTMENTS[condition]
+    
+    seasonal_factor = 1 + (0.1 * (month in SEASONAL_MONTHS))  # 10% boost in key months
+    
+    return MappingProxyType(conditions), market_multiplier, seasonal_factor
+
+def load_model(vertical: str, model_path: str) -> Model:
+    """
+    Load and validate a vertical's model from disk and store it in MODEL_CACHE.
+
+    An ONNX export next to the model is served through ONNX Runtime when it is
+    installed. Otherwise array data in the LightGBM artifact is memory-mapped
+    read-only so page-cached pages can be shared between worker processes.
+
+    Args:
+        vertical (str): Insurance vertical (auto, home, etc.)
+        model_path (str): Path to the serialized model
+
+    Returns:
+        Model: Loaded model
+
+    Raises:
+        ValueError: If the artifact is not a LightGBM model
+    """
+    onnx_path = onnx_model_path(model_path)
+    if ONNX_AVAILABLE and os.path.exists(onnx_path):
+        model = OnnxModel(onnx_path, num_threads=PREDICT_NUM_THREADS)
+    else:
+        model = joblib.load(model_path, mmap_mode='r')
+        
+        if not isinstance(model, lgb.Booster):
+            raise ValueError("Invalid model type")
+        
+    MODEL_CACHE[vertical] = (model, time.time())
+    return model
+
 class LeadScorer:
     """
     Advanced ML model for real-time lead scoring and dynamic pricing with performance monitoring.
     """
     
+    __slots__ = (
+        '_config',
+        '_feature_engineer',
+        '_model',
+        '_model_version',
+        '_feature_importance',
+        '_threshold',
+        '_performance_metrics',
+        '_enable_monitoring',
+        '_price_mult',
+        '_price_fn'
+    )
+    
     def __init__(self, vertical: str, enable_monitoring: bool = True) -> None:
         """
         Initialize lead scoring model with monitoring and validation.
@@ -71,9 +177,13 @@ class LeadScorer:
         self._config = ModelConfig(vertical)
         self._feature_engineer = FeatureEngineer(vertical)
         self._model = None
+        self._model_version = DEFAULT_MODEL_VERSION
+        self._feature_importance = {}
         self._threshold = None
         self._performance_metrics = {}
         self._enable_monitoring = enable_monitoring
+        self._price_mult = PRICE_MULTIPLIERS.get(vertical, 1.0)
+        self._price_fn = self._compile_price_fn()
         
         # Initialize model and thresholds
         self._initialize_model()
@@ -91,42 +201,70 @@ class LeadScorer:
         Raises:
             ValueError: If scoring fails
         """
-        start_time = time.time()
+        start_ns = time.monotonic_ns()
         
         try:
-            # Convert lead data to DataFrame
-            df = pd.DataFrame([lead_data])
+            # Build the feature vector directly, bypassing pandas
+            features, _ = self._feature_engineer.transform_single(lead_data)
+            
+            # Generate prediction
+            score = float(self._model.predict(features, num_threads=PREDICT_NUM_THREADS)[0])
             
-            # Feature engineering
-            features, importance = self._feature_engineer.transform_features(
-                df, return_importance=True
+            # Price and confidence from the compiled kernel
+            _, market_multiplier, seasonal_factor = _market_state(int(time.time() // 60))
+            price, confidence = self._price_fn(score, market_multiplier, seasonal_factor)
+            
+            return self._build_result(
+                score, price, confidence, (time.monotonic_ns() - start_ns) / 1e6
             )
             
-            # Generate prediction
-            score = float(self._model.predict(features)[0])
+        except Exception as e:
+            SCORING_ERRORS.inc()
+            raise ValueError(f"Lead scoring failed: {str(e)}")
+
+    def score_leads(self, leads: List[Dict]) -> List[Dict]:
+        """
+        Score and price a batch of leads through a single model prediction.
+
+        Feature engineering and prediction run once over the whole batch so
+        per-call feature engineering and LightGBM overhead is amortized across
+        all leads.
+
+        Args:
+            leads (List[Dict]): Lead information and features, one dict per lead
+
+        Returns:
+            List[Dict]: Score, price, and confidence metrics in input order
+
+        Raises:
+            ValueError: If scoring fails
+        """
+        if not leads:
+            return []
+
+        start_ns = time.monotonic_ns()
+        
+        try:
+            # Feature engineering over per-feature column arrays
+            features, _ = self._feature_engineer.transform_records(leads)
             
-            # Calculate price
-            price = self.calculate_price(
-                score,
-                market_conditions=self._get_market_conditions()
+            # Generate predictions for the whole batch
+            scores = self._model.predict(features, num_threads=PREDICT_NUM_THREADS)
+            
+            # Price and confidence for the whole batch, market state is shared
+            _, market_multiplier, seasonal_factor = _market_state(int(time.time() // 60))
+            prices, confidences = batch_price_and_confidence(
+                scores, self._price_mult, market_multiplier, seasonal_factor
             )
             
-            # Track performance metrics
-            if self._enable_monitoring:
-                latency = (time.time() - start_time) * 1000
-                SCORING_LATENCY.observe(latency)
-                
-                if score >= self._threshold:
-                    ACCEPTANCE_RATE.inc()
+            latency = (time.monotonic_ns() - start_ns) / 1e6
             
-            return {
-                'score': score,
-                'price': price,
-                'confidence': self._calculate_confidence(score),
-                'feature_importance': importance,
-                'threshold': self._threshold,
-                'latency_ms': (time.time() - start_time) * 1000
-            }
+            return [
+                self._build_result(score, round(price, 2), confidence, latency)
+                for score, price, confidence in zip(
+                    scores.tolist(), prices.tolist(), confidences.tolist()
+                )
+            ]
             
         except Exception as e:
             SCORING_ERRORS.inc()
@@ -143,25 +281,16 @@ class LeadScorer:
         Returns:
             float: Optimized lead price
         """
-        # Base price calculation
-        base_price = 50 + (score * 100)  # $50-150 range
-        
-        # Apply vertical multiplier
-        vertical = self._config._vertical
-        base_price *= PRICE_MULTIPLIERS.get(vertical, 1.0)
-        
         # Apply market adjustments
-        for condition, adjustment in market_conditions.items():
+        market_multiplier = 1.0
+        for condition in market_conditions:
             if condition in MARKET_ADJUSTMENTS:
-                base_price *= MARKET_ADJUSTMENTS[condition]
+                market_multiplier *= MARKET_ADJUSTMENTS[condition]
         
-        # Apply seasonal adjustment
-        month = datetime.now().month
-        seasonal_factor = 1 + (0.1 * (month in [1, 4, 7, 10]))  # 10% boost in key months
-        base_price *= seasonal_factor
+        _, _, seasonal_factor = _market_state(int(time.time() // 60))
         
-        # Ensure price stays within reasonable bounds
-        return round(min(max(base_price, 25.0), 500.0), 2)
+        price, _ = self._price_fn(score, market_multiplier, seasonal_factor)
+        return price
 
     def reload_model(self) -> bool:
         """
@@ -173,18 +302,8 @@ class LeadScorer:
         try:
             model_path = self._config.get_model_path()
             
-            # Load model with validation
-            new_model = joblib.load(model_path)
-            
-            if not isinstance(new_model, lgb.Booster):
-                raise ValueError("Invalid model type")
-            
-            # Update model and cache
-            self._model = new_model
-            MODEL_CACHE[self._config._vertical] = (new_model, time.time())
-            
-            # Update threshold
-            self._threshold = self._config.get_scoring_threshold()
+            # Load model with validation and update cache
+            self._set_model(load_model(self._config._vertical, model_path))
             
             return True
             
@@ -192,6 +311,29 @@ class LeadScorer:
             SCORING_ERRORS.inc()
             raise ValueError(f"Model reload failed: {str(e)}")
 
+    @property
+    def is_fitted(self) -> bool:
+        """Whether the feature preprocessors are fitted, as required by score_lead."""
+        return self._feature_engineer.is_fitted
+
+    def get_model_version(self) -> str:
+        """
+        Get the version of the loaded model.
+
+        Returns:
+            str: Model version
+        """
+        return self._model_version
+
+    def get_feature_importance(self) -> Dict:
+        """
+        Get feature importance scores cached at model load.
+
+        Returns:
+            Dict: Feature importance scores
+        """
+        return self._feature_importance
+
     def update_threshold(self, new_threshold: float, force_update: bool = False) -> bool:
         """
         Update scoring threshold with validation.
@@ -218,43 +360,76 @@ class LeadScorer:
         """Initialize and validate model and configuration."""
         vertical = self._config._vertical
         
-        # Check cache first
-        if vertical in MODEL_CACHE:
+        # Fast path: models are normally preloaded at startup
+        try:
             model, cache_time = MODEL_CACHE[vertical]
+        except KeyError:
+            pass
+        else:
             if time.time() - cache_time < 3600:  # 1 hour cache
-                self._model = model
-                self._threshold = self._config.get_scoring_threshold()
+                self._set_model(model)
                 return
         
         # Load model if not in cache
         self.reload_model()
 
-    def _get_market_conditions(self) -> Dict:
-        """Get current market conditions for pricing adjustments."""
-        hour = datetime.now().hour
-        day = datetime.now().weekday()
+    def _set_model(self, model: Model) -> None:
+        """Activate a model and refresh state derived from it."""
+        self._model = model
+        self._model_version = str(model.params.get('version') or DEFAULT_MODEL_VERSION)
         
-        conditions = {}
+        # Importance is model-global, compute once per model instead of per request
+        self._feature_importance = self._feature_engineer.get_feature_importance()
         
-        # Peak hours (9AM-5PM weekdays)
-        if 9 <= hour <= 17 and day < 5:
-            conditions['peak_hours'] = True
-        else:
-            conditions['off_peak'] = True
-            
-        # Weekend adjustment
-        if day >= 5:
-            conditions['weekend'] = True
+        # Update threshold
+        self._threshold = self._config.get_scoring_threshold()
+
+    def _build_result(
+        self,
+        score: float,
+        price: float,
+        confidence: float,
+        latency: float
+    ) -> Dict:
+        """Record monitoring metrics for a scored lead and build the response."""
+        # Track performance metrics
+        if self._enable_monitoring:
+            SCORING_LATENCY.observe(latency)
             
+            if score >= self._threshold:
+                ACCEPTANCE_RATE.inc()
+        
+        return {
+            'score': score,
+            'price': price,
+            'confidence': confidence,
+            'feature_importance': self._feature_importance,
+            'threshold': self._threshold,
+            'latency_ms': latency
+        }
+
+    def _get_market_conditions(self) -> Mapping[str, bool]:
+        """Get current market conditions for pricing adjustments."""
+        conditions, _, _ = _market_state(int(time.time() // 60))
         return conditions
 
-    def _calculate_confidence(self, score: float) -> float:
-        """Calculate confidence level for the score."""
-        # Higher confidence near extreme values
-        if score > 0.8 or score < 0.2:
-            return 0.9
-        # Medium confidence in mid-range
-        elif 0.4 <= score <= 0.6:
-            return 0.7
-        # Default confidence
-        return 0.8
\ No newline at end of file
+    def _compile_price_fn(self) -> Callable[[float, float, float], Tuple[float, float]]:
+        """
+        Build a price and confidence function specialized for this scorer's vertical.
+
+        The vertical multiplier is bound as a closure constant and the arithmetic
+        runs in a single compiled kernel, so the hot path has no table lookups.
+        """
+        vertical_multiplier = self._price_mult
+        
+        def price_fn(
+            score: float,
+            market_multiplier: float,
+            seasonal_factor: float
+        ) -> Tuple[float, float]:
+            price, confidence = price_and_confidence(
+                score, vertical_multiplier, market_multiplier, seasonal_factor
+            )
+            return round(price, 2), confidence
+        
+        return price_fn
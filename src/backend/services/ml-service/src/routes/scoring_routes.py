@@ -5,25 +5,68 @@ Version: 1.0.0
 """
 
 # External imports - version pinned
-from fastapi import APIRouter, HTTPException, BackgroundTasks, Depends  # version: 0.100+
-from pydantic import BaseModel, Field, validator  # version: 2.0+
+from fastapi import (  # version: 0.100+
+    APIRouter,
+    BackgroundTasks,
+    Depends,
+    HTTPException,
+    Request,
+    Response
+)
+from fastapi.responses import ORJSONResponse  # version: 0.100+
+from fastapi.routing import APIRoute  # version: 0.100+
+from pydantic import BaseModel, Field  # version: 2.0+
 from prometheus_client import Counter, Histogram  # version: 0.17+
-from typing import Dict, Optional, List
+from typing import Any, Callable, Dict, Optional, List, Literal, get_args
+import msgspec  # version: 0.18+
+import orjson  # version: 3.9+
 import time
 import logging
 
 # Internal imports
+from ..config.model_config import FEATURE_CONFIG
 from ..services.scoring_service import ScoringService
 
 # Configure logging
 logger = logging.getLogger(__name__)
 
-# Initialize router with prefix and tags
-router = APIRouter(prefix="/api/v1/scoring", tags=["scoring"])
+class ORJSONRequest(Request):
+    """Request whose JSON body is decoded with orjson."""
+
+    async def json(self) -> Any:
+        if not hasattr(self, '_json'):
+            self._json = orjson.loads(await self.body())
+        return self._json
+
+class ORJSONRoute(APIRoute):
+    """Route that parses JSON request bodies with orjson."""
+
+    def get_route_handler(self) -> Callable:
+        original_handler = super().get_route_handler()
+
+        async def orjson_route_handler(request: Request) -> Response:
+            return await original_handler(ORJSONRequest(request.scope, request.receive))
+
+        return orjson_route_handler
+
+# Initialize router with prefix and tags, using orjson for request and response bodies
+router = APIRouter(
+    prefix="/api/v1/scoring",
+    tags=["scoring"],
+    default_response_class=ORJSONResponse,
+    route_class=ORJSONRoute
+)
 
 # Initialize scoring service
 scoring_service = ScoringService()
 
+# Supported insurance verticals
+Vertical = Literal['auto', 'home', 'health', 'life', 'renters', 'commercial']
+VALID_VERTICALS = frozenset(get_args(Vertical))
+
+# Maximum scoring request body size
+MAX_REQUEST_BYTES = 102400  # 100KB limit
+
 # Prometheus metrics
 REQUEST_COUNTER = Counter(
     'scoring_requests_total',
@@ -41,25 +84,28 @@ LATENCY_HISTOGRAM = Histogram(
     ['vertical']
 )
 
-class LeadRequest(BaseModel):
-    """Pydantic model for lead scoring request validation."""
-    vertical: str = Field(..., description="Insurance vertical type")
-    lead_data: Dict = Field(..., description="Lead information and features")
-    session_id: str = Field(..., description="Unique session identifier")
-    traffic_source: Optional[str] = Field(None, description="Traffic source identifier")
-
-    @validator('vertical')
-    def validate_vertical(cls, v):
-        valid_verticals = ['auto', 'home', 'health', 'life', 'renters', 'commercial']
-        if v not in valid_verticals:
-            raise ValueError(f"Invalid vertical. Must be one of: {valid_verticals}")
-        return v
-
-    @validator('lead_data')
-    def validate_lead_data(cls, v, values):
-        if len(str(v)) > 102400:  # 100KB limit
-            raise ValueError("Lead data exceeds size limit")
-        return v
+# Pre-bound metric children to skip label resolution on the request path
+_REQUEST_COUNTERS = {
+    vertical: REQUEST_COUNTER.labels(vertical=vertical) for vertical in VALID_VERTICALS
+}
+_LATENCY_HISTOGRAMS = {
+    vertical: LATENCY_HISTOGRAM.labels(vertical=vertical) for vertical in VALID_VERTICALS
+}
+_ERROR_COUNTERS = {
+    (vertical, error_type): ERROR_COUNTER.labels(vertical=vertical, error_type=error_type)
+    for vertical in VALID_VERTICALS
+    for error_type in ('validation_error', 'system_error')
+}
+
+class LeadRequest(msgspec.Struct, frozen=True):
+    """msgspec struct for lead scoring request decoding and validation."""
+    vertical: Vertical  # Insurance vertical type
+    lead_data: Dict[str, Any]  # Lead information and features
+    session_id: str  # Unique session identifier
+    traffic_source: Optional[str] = None  # Traffic source identifier
+
+# Typed decoder, JSON is decoded and validated straight into LeadRequest
+_LEAD_REQUEST_DECODER = msgspec.json.Decoder(LeadRequest)
 
 class ThresholdUpdate(BaseModel):
     """Pydantic model for threshold update requests."""
@@ -67,20 +113,50 @@ class ThresholdUpdate(BaseModel):
     threshold: float = Field(..., ge=0.0, le=1.0, description="New scoring threshold")
     reason: Optional[str] = Field(None, description="Reason for threshold update")
 
-@router.post("/score")
-async def score_lead(request: LeadRequest, background_tasks: BackgroundTasks):
+async def enforce_request_size(request: Request):
+    """Reject oversized scoring requests from the Content-Length header."""
+    content_length = request.headers.get('content-length')
+    if content_length is None:
+        return
+
+    try:
+        size = int(content_length)
+    except ValueError:
+        raise HTTPException(status_code=400, detail="Invalid Content-Length header")
+
+    if size > MAX_REQUEST_BYTES:
+        raise HTTPException(status_code=413, detail="Lead data exceeds size limit")
+
+async def parse_lead_request(request: Request) -> LeadRequest:
+    """Decode and validate the scoring request body with msgspec."""
+    body = await request.body()
+    if len(body) > MAX_REQUEST_BYTES:
+        raise HTTPException(status_code=413, detail="Lead data exceeds size limit")
+
+    try:
+        return _LEAD_REQUEST_DECODER.decode(body)
+    except msgspec.ValidationError as e:
+        raise HTTPException(status_code=422, detail=str(e))
+    except msgspec.DecodeError as e:
+        raise HTTPException(status_code=400, detail=f"Invalid JSON body: {str(e)}")
+
+@router.post("/score", dependencies=[Depends(enforce_request_size)])
+async def score_lead(
+    background_tasks: BackgroundTasks,
+    request: LeadRequest = Depends(parse_lead_request)
+):
     """
     Score an insurance lead with comprehensive monitoring and error handling.
     """
-    start_time = time.time()
-    REQUEST_COUNTER.labels(vertical=request.vertical).inc()
+    start_ns = time.monotonic_ns()
+    _REQUEST_COUNTERS[request.vertical].inc()
 
     try:
         # Log request metadata
         logger.info(f"Scoring request received for vertical: {request.vertical}")
 
         # Score lead with monitoring
-        with LATENCY_HISTOGRAM.labels(vertical=request.vertical).time():
+        with _LATENCY_HISTOGRAMS[request.vertical].time():
             result = await scoring_service.score_lead(
                 vertical=request.vertical,
                 lead_data=request.lead_data
@@ -89,7 +165,7 @@ async def score_lead(request: LeadRequest, background_tasks: BackgroundTasks):
         # Add request metadata to response
         result.update({
             'request_id': request.session_id,
-            'processing_time': round((time.time() - start_time) * 1000, 2)
+            'processing_time': round((time.monotonic_ns() - start_ns) / 1e6, 2)
         })
 
         # Schedule background analytics update
@@ -103,18 +179,12 @@ async def score_lead(request: LeadRequest, background_tasks: BackgroundTasks):
         return result
 
     except ValueError as e:
-        ERROR_COUNTER.labels(
-            vertical=request.vertical,
-            error_type='validation_error'
-        ).inc()
+        _ERROR_COUNTERS[(request.vertical, 'validation_error')].inc()
         logger.error(f"Validation error: {str(e)}")
         raise HTTPException(status_code=400, detail=str(e))
 
     except Exception as e:
-        ERROR_COUNTER.labels(
-            vertical=request.vertical,
-            error_type='system_error'
-        ).inc()
+        _ERROR_COUNTERS[(request.vertical, 'system_error')].inc()
         logger.error(f"System error: {str(e)}")
         raise HTTPException(status_code=500, detail="Internal scoring error")
 
@@ -174,6 +244,17 @@ async def update_threshold(request: ThresholdUpdate):
     except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e))
 
+@router.on_event("startup")
+async def preload_models():
+    """Load every configured vertical's model before serving traffic."""
+    # Verticals without a feature configuration cannot be scored, skip them
+    await scoring_service.preload_models(VALID_VERTICALS & FEATURE_CONFIG.keys())
+
+@router.on_event("shutdown")
+async def stop_scoring_service():
+    """Stop scoring service background tasks."""
+    await scoring_service.close()
+
 async def update_scoring_analytics(vertical: str, score: float, confidence: float):
     """Background task to update scoring analytics."""
     try:
@@ -7,12 +7,22 @@ Version: 1.0.0
 
 import asyncio  # version: system
 import logging  # version: system
+import os  # version: system
+from concurrent.futures import ThreadPoolExecutor  # version: system
 import numpy as np  # version: 1.24+
+from dataclasses import dataclass, field  # version: system
 from prometheus_client import Counter, Histogram, Gauge  # version: 0.17+
-from typing import Dict
+from typing import Callable, Dict, Iterable, List, Optional, Set, Tuple
 
-from ..models.lead_scorer import LeadScorer
-from ..config.model_config import ModelConfig
+from ..models.lead_scorer import LeadScorer, PRICE_MULTIPLIERS
+from ..config.model_config import (
+    DEFAULT_SCORING_THRESHOLD,
+    FEATURE_CONFIG,
+    ModelConfig,
+    clear_model_path_cache,
+    load_config
+)
+from ..utils.scoring_math import finalize_score
 
 # Configure logging
 logger = logging.getLogger(__name__)
@@ -22,6 +32,99 @@ SCORING_LATENCY = Histogram('ml_scoring_latency_seconds', 'Lead scoring latency'
 SCORING_ERRORS = Counter('ml_scoring_errors_total', 'Lead scoring errors', ['vertical', 'error_type'])
 MODEL_VERSIONS = Gauge('ml_model_version', 'Current model version', ['vertical'])
 
+# Adaptive batching: concurrent score_lead calls for a vertical are coalesced
+# into one prediction, bounded by batch size and the extra wait per request
+MAX_BATCH_SIZE = 32
+MAX_BATCH_WAIT_SECONDS = 0.005
+
+# Threads running model inference off the event loop
+SCORING_WORKERS = int(os.getenv('ML_SCORING_WORKERS', str(os.cpu_count() or 1)))
+
+# Empty kernel input for results without feature importances
+NO_IMPORTANCES = np.ones(0, dtype=np.float64)
+
+# Consecutive errors that open a vertical's circuit breaker
+CIRCUIT_BREAKER_THRESHOLD = 5
+
+@dataclass(slots=True)
+class VerticalState:
+    """Per-vertical scoring configuration, circuit breaker and metric state."""
+    threshold: float = DEFAULT_SCORING_THRESHOLD
+    market_adjustments: Dict[str, float] = field(default_factory=dict)
+    error_count: int = 0
+    circuit_open: bool = False
+    version_gauge: Optional[Gauge] = None
+
+def _make_pipeline(
+    scorer: LeadScorer,
+    market_adjustments: Dict[str, float],
+    vertical_multiplier: float,
+    threshold: float
+) -> Callable[[List[Dict]], List[Dict]]:
+    """
+    Build a vertical's batch scoring pipeline with its configuration bound as closure constants.
+
+    Args:
+        scorer: The vertical's lead scorer
+        market_adjustments: Market adjustment multipliers
+        vertical_multiplier: Vertical-specific price multiplier
+        threshold: Scoring threshold reported with results
+
+    Returns:
+        Function scoring a batch of leads into result dicts, in input order
+    """
+    score_lead = scorer.score_lead
+    score_leads = scorer.score_leads
+    get_model_version = scorer.get_model_version
+    multipliers = np.fromiter(
+        market_adjustments.values(), dtype=np.float64, count=len(market_adjustments)
+    )
+    
+    def pipeline(leads: List[Dict]) -> List[Dict]:
+        # A lone lead skips the DataFrame build through the single-lead transform
+        if len(leads) == 1 and scorer.is_fitted:
+            scoring_results = [score_lead(leads[0])]
+        else:
+            scoring_results = score_leads(leads)
+        model_version = get_model_version()
+        importance_source, importances = None, NO_IMPORTANCES
+        
+        results = []
+        for scoring_result in scoring_results:
+            # Scorers share one importance dict across results, convert it once
+            feature_importance = scoring_result.get('feature_importance', {})
+            if feature_importance is not importance_source:
+                importance_source = feature_importance
+                importances = np.fromiter(
+                    feature_importance.values(),
+                    dtype=np.float64,
+                    count=len(feature_importance)
+                )
+                
+            # Apply market adjustments and calculate final price
+            adjusted_score, price = finalize_score(
+                scoring_result['score'],
+                scoring_result['confidence'],
+                multipliers,
+                importances,
+                vertical_multiplier
+            )
+            
+            results.append({
+                'score': adjusted_score,
+                'original_score': scoring_result['score'],
+                'confidence': scoring_result['confidence'],
+                'price': price,
+                'market_factors': market_adjustments,
+                'feature_importance': feature_importance,
+                'model_version': model_version,
+                'threshold': threshold
+            })
+            
+        return results
+    
+    return pipeline
+
 class ScoringService:
     """
     Enhanced service class managing lead scoring operations, model lifecycle, and performance monitoring.
@@ -35,24 +138,44 @@ class ScoringService:
         self._scorers: Dict[str, LeadScorer] = {}
         self._configs: Dict[str, ModelConfig] = {}
         
-        # Create async lock for thread-safe operations
+        # Per-vertical scoring pipelines, rebuilt when configuration changes
+        self._pipelines: Dict[str, Callable[[List[Dict]], List[Dict]]] = {}
+        
+        # Create async lock for thread-safe operations, scorer initialization
+        # is serialized per vertical only
         self._lock = asyncio.Lock()
+        self._vertical_locks: Dict[str, asyncio.Lock] = {}
+        
+        # Thresholds, market adjustments, circuit breakers and version gauges per vertical
+        self._states: Dict[str, VerticalState] = {}
+        
+        # Pre-bound error counter children, skipping label resolution per call
+        self._error_counters: Dict[Tuple[str, str], Counter] = {}
+        
+        # Per-vertical batching queues and their drainer tasks
+        self._batch_queues: Dict[str, asyncio.Queue] = {}
+        self._batch_tasks: Dict[str, asyncio.Task] = {}
         
-        # Initialize thresholds and market adjustments
-        self._thresholds: Dict[str, float] = {}
-        self._market_adjustments: Dict[str, Dict] = {}
+        # Batches in flight across verticals, bounded so each has a worker thread
+        self._batch_slots = asyncio.Semaphore(SCORING_WORKERS)
+        self._inflight_batches: Set[asyncio.Task] = set()
         
-        # Initialize circuit breakers
-        self._error_counts: Dict[str, int] = {}
-        self._circuit_open: Dict[str, bool] = {}
+        # Feature engineering and prediction release the GIL in NumPy and
+        # LightGBM, so batches run on worker threads and the loop keeps serving
+        self._executor = ThreadPoolExecutor(
+            max_workers=SCORING_WORKERS, thread_name_prefix='scoring'
+        )
         
         logger.info("ScoringService initialized successfully")
 
-    @SCORING_LATENCY.time()
     async def score_lead(self, vertical: str, lead_data: Dict) -> Dict:
         """
         Scores a lead using vertical-specific model with market adjustments.
         
+        Concurrent calls for the same vertical are queued and scored together
+        through score_leads, so each prediction covers up to MAX_BATCH_SIZE
+        leads while adding at most MAX_BATCH_WAIT_SECONDS of latency.
+        
         Args:
             vertical: Insurance vertical (auto, home, etc.)
             lead_data: Lead information and features
@@ -63,55 +186,70 @@ class ScoringService:
         Raises:
             ValueError: If scoring fails or vertical is unsupported
         """
+        if not vertical or not lead_data:
+            raise ValueError("Lead scoring failed: Missing required parameters")
+        self._check_vertical(vertical)
+            
+        future = asyncio.get_running_loop().create_future()
+        self._get_batch_queue(vertical).put_nowait((lead_data, future))
+        return await future
+
+    @SCORING_LATENCY.time()
+    async def score_leads(
+        self,
+        vertical: str,
+        leads: List[Dict],
+        record_errors: bool = True
+    ) -> List[Dict]:
+        """
+        Scores a batch of leads for one vertical through a single model prediction.
+        
+        Args:
+            vertical: Insurance vertical (auto, home, etc.)
+            leads: Lead information and features, one dict per lead
+            record_errors: Count a failure toward error metrics and the circuit
+                breaker, disabled when the caller retries the leads individually
+            
+        Returns:
+            List of dicts containing score, confidence, price and market factors,
+            in input order
+            
+        Raises:
+            ValueError: If scoring fails or vertical is unsupported
+        """
+        # Reject unknown verticals before any per-vertical state is created
+        self._check_vertical(vertical)
+        
         try:
             # Validate vertical and lead data
-            if not vertical or not lead_data:
+            if not vertical or not leads or not all(leads):
                 raise ValueError("Missing required parameters")
                 
             # Check circuit breaker
-            if self._circuit_open.get(vertical, False):
+            state = self._state(vertical)
+            if state.circuit_open:
                 logger.warning(f"Circuit breaker open for vertical: {vertical}")
-                return self._get_fallback_score(vertical)
-            
-            # Get or initialize scorer
-            scorer = await self._get_scorer(vertical)
+                return [self._get_fallback_score(vertical) for _ in leads]
             
-            # Generate base score with monitoring
-            scoring_result = scorer.score_lead(lead_data)
+            # Get or initialize scorer and its pipeline
+            await self._get_scorer(vertical)
             
-            # Apply market adjustments
-            adjusted_score = self._apply_market_adjustments(
-                vertical,
-                scoring_result['score'],
-                scoring_result['confidence']
-            )
-            
-            # Calculate final price
-            price = self._calculate_price(
-                vertical,
-                adjusted_score,
-                scoring_result.get('feature_importance', {})
+            # Score, adjust and price the batch off the event loop
+            results = await asyncio.get_running_loop().run_in_executor(
+                self._executor, self._pipelines[vertical], leads
             )
             
             # Record successful scoring
             self._record_success(vertical)
             
-            return {
-                'score': adjusted_score,
-                'original_score': scoring_result['score'],
-                'confidence': scoring_result['confidence'],
-                'price': price,
-                'market_factors': self._market_adjustments.get(vertical, {}),
-                'feature_importance': scoring_result.get('feature_importance', {}),
-                'model_version': scorer.get_model_version(),
-                'threshold': self._thresholds.get(vertical, 0.65)
-            }
+            return results
             
         except Exception as e:
             # Record error and check circuit breaker
-            self._record_error(vertical, str(e))
-            SCORING_ERRORS.labels(vertical=vertical, error_type=type(e).__name__).inc()
-            logger.error(f"Lead scoring failed for vertical {vertical}: {str(e)}")
+            if record_errors:
+                self._record_error(vertical, str(e))
+                self._error_counter(vertical, type(e).__name__).inc()
+                logger.error(f"Lead scoring failed for vertical {vertical}: {str(e)}")
             raise ValueError(f"Lead scoring failed: {str(e)}")
 
     async def reload_models(self) -> Dict[str, Dict]:
@@ -119,114 +257,259 @@ class ScoringService:
         Reloads ML models with version validation and monitoring.
         
         Returns:
-            Dict containing reload status per vertical including versions
-            
-        Raises:
-            RuntimeError: If model reload fails
+            Dict containing reload status per vertical including versions,
+            failures are reported per vertical
         """
         async with self._lock:
+            # Re-check model paths and configs, deploys may have changed them
+            clear_model_path_cache()
+            load_config.cache_clear()
+            
+            reload_status = {}
+            
+            for vertical, scorer in list(self._scorers.items()):
+                try:
+                    # Reload model with validation
+                    success = scorer.reload_model()
+                    
+                    # Update model version metric
+                    state = self._state(vertical)
+                    state.version_gauge.set(float(scorer.get_model_version()))
+                    
+                    # Update configuration, thresholds and market adjustments
+                    config = load_config(vertical)
+                    self._configs[vertical] = config
+                    self._apply_config(vertical, scorer, state, config)
+                    
+                    reload_status[vertical] = {
+                        'success': success,
+                        'version': scorer.get_model_version(),
+                        'threshold': state.threshold
+                    }
+                    
+                    logger.info(f"Successfully reloaded model for vertical: {vertical}")
+                    
+                except Exception as e:
+                    reload_status[vertical] = {
+                        'success': False,
+                        'error': str(e)
+                    }
+                    logger.error(f"Failed to reload model for vertical {vertical}: {str(e)}")
+            
+            return reload_status
+
+    async def preload_models(self, verticals: Iterable[str]) -> Dict[str, bool]:
+        """
+        Loads scorers and models ahead of traffic to avoid first-request warmup.
+        
+        Args:
+            verticals: Verticals to preload
+            
+        Returns:
+            Dict containing preload success per vertical
+        """
+        preload_status = {}
+        
+        for vertical in sorted(verticals):
             try:
-                reload_status = {}
-                
-                for vertical in self._scorers.keys():
-                    try:
-                        # Reload model with validation
-                        scorer = self._scorers[vertical]
-                        success = scorer.reload_model()
-                        
-                        # Update model version metric
-                        MODEL_VERSIONS.labels(vertical=vertical).set(
-                            float(scorer.get_model_version())
-                        )
-                        
-                        # Update configuration
-                        config = ModelConfig(vertical)
-                        self._configs[vertical] = config
-                        self._thresholds[vertical] = config.get_scoring_threshold()
-                        
-                        # Update market adjustments
-                        self._market_adjustments[vertical] = config.get_market_adjustments()
-                        
-                        reload_status[vertical] = {
-                            'success': success,
-                            'version': scorer.get_model_version(),
-                            'threshold': self._thresholds[vertical]
-                        }
-                        
-                        logger.info(f"Successfully reloaded model for vertical: {vertical}")
-                        
-                    except Exception as e:
-                        reload_status[vertical] = {
-                            'success': False,
-                            'error': str(e)
-                        }
-                        logger.error(f"Failed to reload model for vertical {vertical}: {str(e)}")
-                
-                return reload_status
-                
+                await self._get_scorer(vertical)
+                preload_status[vertical] = True
             except Exception as e:
-                logger.error(f"Model reload failed: {str(e)}")
-                raise RuntimeError(f"Model reload failed: {str(e)}")
+                preload_status[vertical] = False
+                logger.warning(f"Failed to preload model for vertical {vertical}: {str(e)}")
+                
+        logger.info(f"Model preload completed: {preload_status}")
+        return preload_status
+
+    async def get_model_info(self, vertical: Optional[str] = None) -> Dict[str, Dict]:
+        """
+        Returns model version, threshold and feature importance per vertical.
+        
+        Args:
+            vertical: Restrict to one vertical, loading its model if needed
+            
+        Returns:
+            Dict containing model information per vertical
+            
+        Raises:
+            ValueError: If the vertical is unsupported
+        """
+        if vertical is not None:
+            scorers = {vertical: await self._get_scorer(vertical)}
+        else:
+            scorers = dict(self._scorers)
+            
+        return {
+            name: {
+                'model_version': scorer.get_model_version(),
+                'threshold': self._state(name).threshold,
+                'feature_importance': scorer.get_feature_importance(),
+                'circuit_open': self._state(name).circuit_open
+            }
+            for name, scorer in scorers.items()
+        }
+
+    async def close(self) -> None:
+        """
+        Stops batching drainer tasks and the inference thread pool.
+        """
+        for task in list(self._batch_tasks.values()) + list(self._inflight_batches):
+            task.cancel()
+            
+        self._batch_tasks.clear()
+        self._inflight_batches.clear()
+        self._batch_queues.clear()
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+    def _get_batch_queue(self, vertical: str) -> asyncio.Queue:
+        """Return the batching queue for a vertical, starting its drainer on first use."""
+        queue = self._batch_queues.get(vertical)
+        if queue is None:
+            queue = self._batch_queues[vertical] = asyncio.Queue()
+            self._batch_tasks[vertical] = asyncio.create_task(self._batch_loop(vertical, queue))
+            
+        return queue
+
+    async def _batch_loop(self, vertical: str, queue: asyncio.Queue) -> None:
+        """Drain a vertical's queue into batches and dispatch each batch for scoring."""
+        loop = asyncio.get_running_loop()
+        
+        while True:
+            first = await queue.get()
+            
+            # Wait for a free worker before collecting, leads keep queueing
+            # meanwhile and the next batch grows instead of waiting in the pool
+            await self._batch_slots.acquire()
+            batch = [first]
+            deadline = loop.time() + MAX_BATCH_WAIT_SECONDS
+            
+            # Collect more leads until the batch is full or the deadline passes
+            while len(batch) < MAX_BATCH_SIZE:
+                if not queue.empty():
+                    batch.append(queue.get_nowait())
+                    continue
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(queue.get(), timeout=timeout))
+                except asyncio.TimeoutError:
+                    break
+                    
+            # Score concurrently with the next collection, up to one batch per worker
+            task = asyncio.create_task(self._score_batch(vertical, batch))
+            self._inflight_batches.add(task)
+            task.add_done_callback(self._batch_done)
+
+    def _batch_done(self, task: asyncio.Task) -> None:
+        """Release a finished batch's worker slot."""
+        self._inflight_batches.discard(task)
+        self._batch_slots.release()
+
+    async def _score_batch(self, vertical: str, batch: List[Tuple[Dict, asyncio.Future]]) -> None:
+        """Score queued leads and resolve their futures."""
+        try:
+            # A failed batch is retried lead by lead, only those failures are counted
+            results = await self.score_leads(
+                vertical, [lead_data for lead_data, _ in batch], record_errors=len(batch) == 1
+            )
+        except Exception as e:
+            if len(batch) > 1:
+                # Re-score individually so one bad lead does not fail the others
+                logger.warning(f"Batch scoring failed for vertical {vertical}, retrying per lead")
+                for item in batch:
+                    await self._score_batch(vertical, [item])
+                return
+            _, future = batch[0]
+            if not future.done():
+                future.set_exception(e)
+            return
+            
+        for (_, future), result in zip(batch, results):
+            if not future.done():
+                future.set_result(result)
 
     async def _get_scorer(self, vertical: str) -> LeadScorer:
         """Initialize or retrieve scorer for vertical with validation."""
         if vertical not in self._scorers:
-            async with self._lock:
+            # Validate before creating a lock, so arbitrary strings cannot grow the dict
+            self._check_vertical(vertical)
+            
+            # setdefault runs without awaiting, so tasks on the loop cannot interleave
+            lock = self._vertical_locks.setdefault(vertical, asyncio.Lock())
+            async with lock:
                 if vertical not in self._scorers:
-                    self._scorers[vertical] = LeadScorer(vertical)
-                    self._configs[vertical] = ModelConfig(vertical)
-                    self._thresholds[vertical] = self._configs[vertical].get_scoring_threshold()
-                    self._market_adjustments[vertical] = self._configs[vertical].get_market_adjustments()
+                    # Build everything first and publish the scorer last, so a
+                    # failure leaves no scorer cached without its pipeline
+                    scorer = LeadScorer(vertical)
+                    config = load_config(vertical)
+                    version_gauge = MODEL_VERSIONS.labels(vertical=vertical)
+                    state = self._state(vertical)
+                    self._apply_config(vertical, scorer, state, config)
+                    state.version_gauge = version_gauge
+                    self._configs[vertical] = config
+                    self._scorers[vertical] = scorer
                     
         return self._scorers[vertical]
 
-    def _apply_market_adjustments(self, vertical: str, score: float, confidence: float) -> float:
-        """Apply market-based adjustments to score."""
-        adjustments = self._market_adjustments.get(vertical, {})
-        adjusted_score = score
-        
-        for factor, value in adjustments.items():
-            if confidence >= 0.8:  # Only apply adjustments with high confidence
-                adjusted_score *= value
-                
-        return np.clip(adjusted_score, 0.0, 1.0)
-
-    def _calculate_price(self, vertical: str, score: float, feature_importance: Dict) -> float:
-        """Calculate optimized price based on score and market factors."""
-        base_price = 50 + (score * 100)  # Base range $50-150
-        
-        # Apply vertical-specific multipliers
-        multipliers = {
-            'auto': 1.0,
-            'home': 1.2,
-            'health': 1.5,
-            'life': 1.8,
-            'renters': 0.8,
-            'commercial': 2.0
-        }
-        
-        base_price *= multipliers.get(vertical, 1.0)
+    def _check_vertical(self, vertical: Optional[str]) -> None:
+        """Raise ValueError for verticals without a feature configuration."""
+        if vertical and vertical not in FEATURE_CONFIG:
+            raise ValueError(f"Unsupported insurance vertical: {vertical}")
+
+    def _state(self, vertical: str) -> VerticalState:
+        """Return the state for a vertical, creating it on first use."""
+        state = self._states.get(vertical)
+        if state is None:
+            state = self._states[vertical] = VerticalState()
+            
+        return state
+
+    def _apply_config(
+        self,
+        vertical: str,
+        scorer: LeadScorer,
+        state: VerticalState,
+        config: ModelConfig
+    ) -> None:
+        """Rebuild the vertical's pipeline and store its threshold and market adjustments."""
+        # Read everything before assigning, a bad config leaves the old state intact
+        threshold = config.get_scoring_threshold()
+        market_adjustments = config.get_market_adjustments()
+        pipeline = _make_pipeline(
+            scorer, market_adjustments, PRICE_MULTIPLIERS.get(vertical, 1.0), threshold
+        )
         
-        # Apply feature importance adjustments
-        if feature_importance:
-            importance_factor = sum(feature_importance.values()) / len(feature_importance)
-            base_price *= (0.9 + (importance_factor * 0.2))  # ±10% adjustment
+        state.threshold = threshold
+        state.market_adjustments = market_adjustments
+        self._pipelines[vertical] = pipeline
+
+    def _error_counter(self, vertical: str, error_type: str) -> Counter:
+        """Return the error counter child for a vertical and error type, binding it on first use."""
+        key = (vertical, error_type)
+        counter = self._error_counters.get(key)
+        if counter is None:
+            counter = self._error_counters[key] = SCORING_ERRORS.labels(
+                vertical=vertical, error_type=error_type
+            )
             
-        return round(min(max(base_price, 25.0), 500.0), 2)
+        return counter
 
     def _record_error(self, vertical: str, error: str) -> None:
         """Record error and update circuit breaker status."""
-        self._error_counts[vertical] = self._error_counts.get(vertical, 0) + 1
+        state = self._state(vertical)
+        state.error_count += 1
         
         # Open circuit breaker if error threshold reached
-        if self._error_counts[vertical] >= 5:  # 5 consecutive errors
-            self._circuit_open[vertical] = True
+        if state.error_count >= CIRCUIT_BREAKER_THRESHOLD:
+            state.circuit_open = True
             logger.warning(f"Circuit breaker opened for vertical: {vertical}")
 
     def _record_success(self, vertical: str) -> None:
         """Record successful operation and reset error count."""
-        self._error_counts[vertical] = 0
-        self._circuit_open[vertical] = False
+        state = self._state(vertical)
+        state.error_count = 0
+        state.circuit_open = False
 
     def _get_fallback_score(self, vertical: str) -> Dict:
         """Return fallback scoring result when circuit breaker is open."""
@@ -237,6 +520,6 @@ class ScoringService:
             'market_factors': {},
             'feature_importance': {},
             'model_version': 'fallback',
-            'threshold': self._thresholds.get(vertical, 0.65),
+            'threshold': self._state(vertical).threshold,
             'fallback': True
         }
\ No newline at end of file
@@ -9,19 +9,58 @@ Version: 1.0.0
 
 import numpy as np  # version: 1.24+
 import pandas as pd  # version: 2.0+
+from scipy import sparse  # version: 1.11+
 from sklearn.preprocessing import StandardScaler, LabelEncoder, MinMaxScaler  # version: 1.3+
-from sklearn.feature_extraction.text import TfidfVectorizer, HashingVectorizer  # version: 1.3+
+from sklearn.feature_extraction.text import HashingVectorizer  # version: 1.3+
+from sklearn.utils import murmurhash3_32  # version: 1.3+
 import joblib  # version: 1.3+
-from typing import Dict, Any, Union, Tuple
-from ..config.model_config import ModelConfig
-
-# Global caches for preprocessors and encoders
-CATEGORICAL_ENCODERS: Dict[str, Union[LabelEncoder, Dict[str, int]]] = {}
-TEXT_VECTORIZERS: Dict[str, Union[TfidfVectorizer, HashingVectorizer]] = {}
-NUMERICAL_SCALERS: Dict[str, Union[StandardScaler, MinMaxScaler]] = {}
-PREPROCESSOR_CACHE: Dict[str, Any] = {}
+import xxhash  # version: 3.3+
+from cachetools import LRUCache  # version: 5.3+
+from prometheus_client import Gauge  # version: 0.17+
+import logging
+import os
+import re
+import threading
+from typing import Dict, Any, List, Optional, Union, Tuple
+from ..config.model_config import MODEL_BASE_PATH, load_config
+
+# Configure logging
+logger = logging.getLogger(__name__)
+
+# Fitted preprocessor artifact stored next to each vertical's model
+PREPROCESSORS_FILENAME = 'preprocessors.joblib'
+
+# Width of hashed text features when no fitted vectorizer is available
+TEXT_HASH_FEATURES = 100
+
+# Category that absorbs rare and unseen values
+OTHER_CATEGORY = 'Other'
+
+# Punctuation stripped from text features before vectorizing
+_CLEAN_RE = re.compile(r'[^\w\s]')
+
+# ASCII punctuation deleted with str.translate, _CLEAN_RE only runs on non-ASCII text
+_ASCII_PUNCT_TABLE = str.maketrans(
+    '', '', ''.join(char for char in map(chr, range(128)) if _CLEAN_RE.match(char))
+)
+
+# HashingVectorizer's default word tokenizer, reproduced by the single-lead path
+_TOKEN_RE = re.compile(r"(?u)\b\w\w+\b")
+_INT32_MIN = -2147483648
+
+# Global feature importance, keyed by feature name
 FEATURE_IMPORTANCE: Dict[str, float] = {}
 
+# Initial rows of the per-thread dense batch buffer, grown for larger batches
+FEATURE_BUFFER_ROWS = 32
+
+# Transform cache bounds, the entry count can be overridden by the cache config
+DEFAULT_CACHE_MAX_ENTRIES = 10_000
+MAX_CACHE_ENTRY_BYTES = 1 << 20  # 1MB
+
+# Prometheus metrics
+FEATURE_CACHE_SIZE = Gauge('ml_feature_cache_size', 'Cached feature transformations', ['vertical'])
+
 class FeatureEngineer:
     """
     Enhanced feature engineering pipeline with optimized preprocessing,
@@ -39,12 +78,47 @@ class FeatureEngineer:
         Raises:
             ValueError: If vertical configuration is invalid
         """
-        self._config = ModelConfig(vertical)
+        self._vertical = vertical
+        self._config = load_config(vertical)
         self._feature_config = self._config.get_feature_config()
         self._cache_config = self._config.get_cache_config()
         self._encoders = {}
+        self._category_codes = {}
+        self._category_lookups = {}
         self._vectorizers = {}
         self._scalers = {}
+        
+        # Per-thread scratch row reused by the single-lead path and dense
+        # buffer reused by the batch path
+        self._scratch = threading.local()
+        
+        # Serializes fitting, transforms only read the published parameters
+        self._fit_lock = threading.Lock()
+        
+        # Fitted float32 numerical parameters, scaled = value * scale + offset
+        self._impute_means = None
+        self._num_scale = None
+        self._num_offset = None
+        
+        # Column order per feature group, shared by the batch and single-lead paths
+        self._numerical_features = tuple(self._feature_config['numerical_features'])
+        self._categorical_features = tuple(self._feature_config['categorical_features'])
+        self._text_features = tuple(self._feature_config['text_features'])
+        self._required_features = frozenset(
+            self._numerical_features + self._categorical_features + self._text_features
+        )
+        
+        # Configured numerical bounds as per-column arrays for the single-lead path
+        min_values = self._feature_config.get('min_values', {})
+        max_values = self._feature_config.get('max_values', {})
+        self._num_min = np.array(
+            [min_values.get(column, -np.inf) for column in self._numerical_features],
+            dtype=np.float64
+        )
+        self._num_max = np.array(
+            [max_values.get(column, np.inf) for column in self._numerical_features],
+            dtype=np.float64
+        )
         self._feature_stats = {
             'numerical': {},
             'categorical': {},
@@ -54,10 +128,20 @@ class FeatureEngineer:
         # Initialize preprocessors with validation
         self._initialize_preprocessors()
         
-        # Enable caching if requested
+        # Enable caching if requested, the cache is per instance so it is
+        # released with the scorer on reload
         self._use_cache = use_cache and bool(self._cache_config.get('enable_cache'))
-
-    def transform_features(self, lead_data: pd.DataFrame, return_importance: bool = False) -> Tuple[np.ndarray, Dict]:
+        self._transform_cache = LRUCache(
+            maxsize=self._cache_config.get('max_entries', DEFAULT_CACHE_MAX_ENTRIES)
+        )
+        self._cache_lock = threading.Lock()
+        self._cache_size_gauge = FEATURE_CACHE_SIZE.labels(vertical=vertical)
+
+    def transform_features(
+        self,
+        lead_data: pd.DataFrame,
+        return_importance: bool = False
+    ) -> Tuple[sparse.csr_matrix, Dict]:
         """
         Transform raw lead data into model-ready features with optimized performance.
 
@@ -66,7 +150,7 @@ class FeatureEngineer:
             return_importance (bool): Include feature importance scores
 
         Returns:
-            Tuple[np.ndarray, Dict]: Transformed features and importance scores
+            Tuple[sparse.csr_matrix, Dict]: Transformed features and importance scores
 
         Raises:
             ValueError: If input data is invalid
@@ -75,48 +159,232 @@ class FeatureEngineer:
         self._validate_input_data(lead_data)
         
         # Check cache for existing transformations
-        cache_key = self._generate_cache_key(lead_data)
-        if self._use_cache and cache_key in PREPROCESSOR_CACHE:
-            return PREPROCESSOR_CACHE[cache_key]
+        if self._use_cache:
+            cache_key = self._generate_cache_key(lead_data)
+            with self._cache_lock:
+                cached = self._transform_cache.get(cache_key)
+            if cached is not None:
+                return cached
         
         # Split features by type
         numerical_data = lead_data[self._feature_config['numerical_features']]
         categorical_data = lead_data[self._feature_config['categorical_features']]
         text_data = lead_data[self._feature_config['text_features']]
         
-        # Process features in parallel using joblib
-        transformed_features = joblib.Parallel(n_jobs=-1)(
-            joblib.delayed(self._process_feature_group)(data, feature_type)
-            for data, feature_type in [
-                (numerical_data, 'numerical'),
-                (categorical_data, 'categorical'),
-                (text_data, 'text')
-            ]
-        )
-        
-        # Combine transformed features
-        combined_features = np.hstack(transformed_features)
+        # Process feature groups in-process, a worker pool costs more than
+        # the work for three groups. Numerical and categorical blocks are
+        # written straight into adjacent slices of one reused dense buffer
+        n_numerical = len(self._numerical_features)
+        dense_features = self._dense_buffer(len(lead_data))
+        self.preprocess_numerical(numerical_data, out=dense_features[:, :n_numerical])
+        self.preprocess_categorical(categorical_data, out=dense_features[:, n_numerical:])
+        text_features = self.preprocess_text(text_data)
         
-        # Update feature statistics
-        self._update_feature_stats(lead_data)
+        # Combine into a single float32 CSR matrix, which copies out of the
+        # buffer. Hashed text is mostly zeros, so it is never densified and
+        # LightGBM consumes CSR directly
+        combined_features = sparse.hstack(
+            [sparse.csr_matrix(dense_features), text_features],
+            format='csr',
+            dtype=np.float32
+        )
         
         # Calculate importance scores if requested
         importance_scores = {}
         if return_importance:
             importance_scores = self._calculate_feature_importance(combined_features)
         
-        # Cache results if enabled
-        if self._use_cache:
-            PREPROCESSOR_CACHE[cache_key] = (combined_features, importance_scores)
+        # Cache results if enabled, skipping entries too large to be worth keeping
+        entry_bytes = (
+            combined_features.data.nbytes
+            + combined_features.indices.nbytes
+            + combined_features.indptr.nbytes
+        )
+        if self._use_cache and entry_bytes <= MAX_CACHE_ENTRY_BYTES:
+            with self._cache_lock:
+                self._transform_cache[cache_key] = (combined_features, importance_scores)
+                self._cache_size_gauge.set(len(self._transform_cache))
         
         return combined_features, importance_scores
 
-    def preprocess_numerical(self, numerical_data: pd.DataFrame) -> np.ndarray:
+    def transform_records(
+        self,
+        leads: List[Dict],
+        return_importance: bool = False
+    ) -> Tuple[sparse.csr_matrix, Dict]:
+        """
+        Transform a batch of lead dicts by way of per-feature column arrays.
+
+        Rows are scattered once into one typed array per feature (structure of
+        arrays), avoiding pandas' row-wise construction and dtype inference for
+        a list of dicts.
+
+        Args:
+            leads (List[Dict]): Raw lead data, one dict per lead
+            return_importance (bool): Include feature importance scores
+
+        Returns:
+            Tuple[sparse.csr_matrix, Dict]: Transformed features and importance scores
+
+        Raises:
+            ValueError: If input data is invalid
+        """
+        # Every lead must carry every feature, as in transform_single
+        for lead in leads:
+            missing_columns = self._required_features - lead.keys()
+            if missing_columns:
+                raise ValueError(f"Missing required columns: {missing_columns}")
+        
+        columns = {}
+        
+        # Numerical columns convert in one pass, None values become NaN
+        for column in self._numerical_features:
+            columns[column] = np.array([lead[column] for lead in leads], dtype=np.float64)
+        
+        # Categorical and text columns stay as object arrays
+        for column in self._categorical_features + self._text_features:
+            values = np.empty(len(leads), dtype=object)
+            for i, lead in enumerate(leads):
+                values[i] = lead[column]
+            columns[column] = values
+            
+        return self.transform_columns(columns, return_importance=return_importance)
+
+    def transform_columns(
+        self,
+        columns: Dict[str, np.ndarray],
+        return_importance: bool = False
+    ) -> Tuple[sparse.csr_matrix, Dict]:
+        """
+        Transform lead data given as one array per feature.
+
+        Args:
+            columns (Dict[str, np.ndarray]): Equal-length array per feature
+            return_importance (bool): Include feature importance scores
+
+        Returns:
+            Tuple[sparse.csr_matrix, Dict]: Transformed features and importance scores
+
+        Raises:
+            ValueError: If input data is invalid
+        """
+        return self.transform_features(
+            pd.DataFrame(columns, copy=False), return_importance=return_importance
+        )
+
+    def transform_single(
+        self,
+        lead_data: Dict,
+        return_importance: bool = False
+    ) -> Tuple[np.ndarray, Dict]:
+        """
+        Transform a single lead into a (1, F) feature vector without building a DataFrame.
+
+        Uses the preprocessors fitted by the batch path and writes each feature
+        group directly into a float32 row that is allocated once per thread and
+        reused. The returned array is overwritten by the next call on the same
+        thread, so callers must consume it before transforming another lead.
+
+        Args:
+            lead_data (Dict): Raw lead data
+            return_importance (bool): Include feature importance scores
+
+        Returns:
+            Tuple[np.ndarray, Dict]: Transformed features and importance scores
+
+        Raises:
+            ValueError: If input data is invalid or preprocessors are not fitted
+        """
+        if not self.is_fitted:
+            raise ValueError("Preprocessors are not fitted")
+            
+        missing_columns = self._required_features - lead_data.keys()
+        if missing_columns:
+            raise ValueError(f"Missing required columns: {missing_columns}")
+        
+        feature_dim = self.feature_dim
+        features = getattr(self._scratch, 'row', None)
+        if features is None or features.shape[1] != feature_dim:
+            features = np.empty((1, feature_dim), dtype=np.float32)
+            self._scratch.row = features
+        
+        row = features[0]
+        
+        # Numerical features: validate ranges like the batch path, then impute
+        # and scale against the precomputed arrays
+        values = np.array(
+            [lead_data[column] for column in self._numerical_features], dtype=np.float64
+        )
+        self._validate_numerical_row(values)
+        values = values.astype(np.float32)
+        np.copyto(values, self._impute_means, where=np.isnan(values))
+        offset = len(self._numerical_features)
+        row[:offset] = values * self._num_scale + self._num_offset
+        
+        # Categorical features: direct code lookup, rare and unseen values map to 'Other'
+        for column in self._categorical_features:
+            codes = self._category_codes[column]
+            row[offset] = codes.get(lead_data[column], codes[OTHER_CATEGORY])
+            offset += 1
+        
+        # Text features: default hashing vectorizers are applied inline
+        for column in self._text_features:
+            value = lead_data[column]
+            cleaned = _clean_value(value)
+            vectorizer = self._vectorizers[column]
+            if _is_default_hashing(vectorizer):
+                width = vectorizer.n_features
+                _hash_tokens(cleaned, row[offset:offset + width])
+            else:
+                vectorized = vectorizer.transform([cleaned]).toarray()
+                width = vectorized.shape[1]
+                row[offset:offset + width] = vectorized[0]
+            offset += width
+        
+        importance_scores = {}
+        if return_importance:
+            importance_scores = self._calculate_feature_importance(features)
+        
+        return features, importance_scores
+
+    @property
+    def is_fitted(self) -> bool:
+        """Whether every feature group has fitted preprocessors."""
+        return (
+            'numerical' in self._scalers
+            and all(column in self._category_codes for column in self._categorical_features)
+            and all(column in self._vectorizers for column in self._text_features)
+        )
+
+    @property
+    def cache_size(self) -> int:
+        """Number of cached feature transformations."""
+        return len(self._transform_cache)
+
+    @property
+    def feature_dim(self) -> int:
+        """Width of the transformed feature vector for the fitted preprocessors."""
+        text_dim = 0
+        for column in self._text_features:
+            vectorizer = self._vectorizers[column]
+            if isinstance(vectorizer, HashingVectorizer):
+                text_dim += vectorizer.n_features
+            else:
+                text_dim += len(vectorizer.vocabulary_)
+                
+        return len(self._numerical_features) + len(self._categorical_features) + text_dim
+
+    def preprocess_numerical(
+        self,
+        numerical_data: pd.DataFrame,
+        out: Optional[np.ndarray] = None
+    ) -> np.ndarray:
         """
         Enhanced numerical feature preprocessing with validation and statistics.
 
         Args:
             numerical_data (pd.DataFrame): Numerical features
+            out (np.ndarray, optional): float32 array to write the features into
 
         Returns:
             np.ndarray: Validated and scaled numerical features
@@ -127,59 +395,55 @@ class FeatureEngineer:
         # Validate numerical ranges
         self._validate_numerical_ranges(numerical_data)
         
-        # Handle missing values
-        numerical_data = numerical_data.fillna(numerical_data.mean())
+        # Scalers are fitted offline, never on live traffic
+        if 'numerical' not in self._scalers:
+            raise ValueError("Numerical preprocessors are not fitted")
         
-        # Apply scaling based on configuration
-        scaling_method = self._feature_config['preprocessing']['scaling']
-        if scaling_method == 'standard':
-            scaler = StandardScaler()
+        # Impute and scale in place on a float32 copy with the fitted arrays
+        if out is None:
+            features = numerical_data.to_numpy(dtype=np.float32, copy=True)
         else:
-            scaler = MinMaxScaler()
-            
-        scaled_features = scaler.fit_transform(numerical_data)
-        
-        # Track feature distributions
-        self._track_numerical_stats(numerical_data)
+            features = out
+            np.copyto(features, numerical_data.to_numpy(), casting='same_kind')
+        np.copyto(features, self._impute_means, where=np.isnan(features))
+        features *= self._num_scale
+        features += self._num_offset
         
-        return scaled_features
+        return features
 
-    def preprocess_categorical(self, categorical_data: pd.DataFrame) -> np.ndarray:
+    def preprocess_categorical(
+        self,
+        categorical_data: pd.DataFrame,
+        out: Optional[np.ndarray] = None
+    ) -> np.ndarray:
         """
         Optimized categorical feature encoding with frequency analysis.
 
         Args:
             categorical_data (pd.DataFrame): Categorical features
+            out (np.ndarray, optional): Array to write the codes into
 
         Returns:
-            np.ndarray: Encoded categorical features
+            np.ndarray: Category codes, one column per feature, int32 unless written into out
 
         Raises:
             ValueError: If categorical preprocessing fails
         """
-        encoded_features = []
+        encoded_features = np.empty(categorical_data.shape, dtype=np.int32) if out is None else out
         
-        for column in categorical_data.columns:
-            # Handle rare categories
-            value_counts = categorical_data[column].value_counts()
-            rare_mask = value_counts < self._feature_config.get('min_category_frequency', 10)
-            rare_categories = value_counts[rare_mask].index
-            
-            # Replace rare categories with 'Other'
-            column_data = categorical_data[column].copy()
-            column_data[column_data.isin(rare_categories)] = 'Other'
-            
-            # Apply encoding
-            if column not in self._encoders:
-                self._encoders[column] = LabelEncoder()
+        for i, column in enumerate(categorical_data.columns):
+            # Encodings are fitted offline, never on live traffic
+            if column not in self._category_lookups:
+                raise ValueError(f"Categorical preprocessor is not fitted: {column}")
                 
-            encoded_features.append(
-                self._encoders[column].fit_transform(column_data).reshape(-1, 1)
-            )
+            # Vectorized hash lookup, rare and unseen categories are absent from
+            # the index and their -1 position selects the trailing 'Other' code
+            index, lookup = self._category_lookups[column]
+            encoded_features[:, i] = lookup[index.get_indexer(categorical_data[column].to_numpy())]
         
-        return np.hstack(encoded_features)
+        return encoded_features
 
-    def preprocess_text(self, text_data: pd.DataFrame) -> np.ndarray:
+    def preprocess_text(self, text_data: pd.DataFrame) -> sparse.csr_matrix:
         """
         Advanced text feature processing with multiple vectorizer options.
 
@@ -187,7 +451,7 @@ class FeatureEngineer:
             text_data (pd.DataFrame): Text features
 
         Returns:
-            np.ndarray: Vectorized text features
+            sparse.csr_matrix: Vectorized text features
 
         Raises:
             ValueError: If text preprocessing fails
@@ -198,21 +462,24 @@ class FeatureEngineer:
             # Clean and normalize text
             cleaned_text = self._clean_text(text_data[column])
             
-            # Select vectorizer based on vocabulary size
-            if len(set(' '.join(cleaned_text).split())) > 10000:
-                vectorizer = HashingVectorizer(n_features=100)
-            else:
-                vectorizer = TfidfVectorizer(max_features=100)
-                
-            # Store vectorizer for future use
-            self._vectorizers[column] = vectorizer
-            
-            # Transform text features
-            vectorized_features.append(
-                vectorizer.fit_transform(cleaned_text).toarray()
-            )
+            # Transform only, vectorizers are loaded fitted or stateless hashing
+            vectorized_features.append(self._vectorizers[column].transform(cleaned_text))
         
-        return np.hstack(vectorized_features)
+        return sparse.hstack(vectorized_features, format='csr')
+
+    def get_feature_importance(self) -> Dict[str, float]:
+        """
+        Get current importance scores for this vertical's features.
+
+        Returns:
+            Dict[str, float]: Importance score per feature
+        """
+        features = self._numerical_features + self._categorical_features + self._text_features
+        return {
+            feature: FEATURE_IMPORTANCE[feature]
+            for feature in features
+            if feature in FEATURE_IMPORTANCE
+        }
 
     def update_feature_importance(self, importance_scores: Dict) -> bool:
         """
@@ -250,8 +517,156 @@ class FeatureEngineer:
             
         # Clear existing preprocessors
         self._encoders.clear()
+        self._category_codes.clear()
+        self._category_lookups.clear()
         self._vectorizers.clear()
         self._scalers.clear()
+        
+        # Load preprocessors fitted at training time
+        preprocessors_path = os.path.join(MODEL_BASE_PATH, self._vertical, PREPROCESSORS_FILENAME)
+        if os.path.exists(preprocessors_path):
+            try:
+                preprocessors = joblib.load(preprocessors_path)
+                self._scalers.update(preprocessors.get('scalers', {}))
+                self._category_codes.update(preprocessors.get('category_codes', {}))
+                self._vectorizers.update(preprocessors.get('vectorizers', {}))
+                self._feature_stats['numerical'].update(preprocessors.get('numerical_stats', {}))
+            except Exception as e:
+                raise ValueError(f"Failed to load preprocessors: {str(e)}")
+        
+        if 'numerical' in self._scalers:
+            self._set_numerical_params(self._scalers['numerical'])
+        for column, codes in self._category_codes.items():
+            self._set_category_lookup(column, codes)
+        
+        # Hashing needs no fitting, use it for text columns without a fitted vectorizer
+        for column in self._text_features:
+            if column not in self._vectorizers:
+                self._vectorizers[column] = HashingVectorizer(n_features=TEXT_HASH_FEATURES)
+                
+        # Fitting on live traffic would freeze encodings learned from whatever
+        # leads came first, so transforms fail until the artifact is deployed
+        if not self.is_fitted:
+            logger.error(
+                f"Fitted preprocessors missing for vertical {self._vertical} at "
+                f"{preprocessors_path}, fit them offline with fit() and save_preprocessors()"
+            )
+
+    def fit(self, lead_data: pd.DataFrame) -> None:
+        """
+        Fit the numerical and categorical preprocessors on training data.
+
+        Runs offline, persist the result with save_preprocessors().
+
+        Args:
+            lead_data (pd.DataFrame): Training lead data
+
+        Raises:
+            ValueError: If input data is invalid
+        """
+        self._validate_input_data(lead_data)
+        
+        with self._fit_lock:
+            self._fit_numerical(lead_data[list(self._numerical_features)])
+            for column in self._categorical_features:
+                self._fit_categorical(column, lead_data[column])
+
+    def save_preprocessors(self) -> str:
+        """
+        Persist fitted preprocessors next to the vertical's model.
+
+        Returns:
+            str: Path of the saved preprocessors
+
+        Raises:
+            ValueError: If preprocessors are not fitted
+        """
+        if not self.is_fitted:
+            raise ValueError("Preprocessors are not fitted")
+            
+        preprocessors_path = os.path.join(MODEL_BASE_PATH, self._vertical, PREPROCESSORS_FILENAME)
+        joblib.dump({
+            'scalers': self._scalers,
+            'category_codes': self._category_codes,
+            'vectorizers': self._vectorizers,
+            'numerical_stats': self._feature_stats['numerical']
+        }, preprocessors_path)
+        
+        return preprocessors_path
+
+    def _fit_numerical(self, numerical_data: pd.DataFrame) -> None:
+        """Fit the numerical scaler and imputation means."""
+        # Track feature distributions, the means impute missing values
+        self._track_numerical_stats(numerical_data)
+        
+        # Apply scaling based on configuration
+        scaling_method = self._feature_config['preprocessing']['scaling']
+        if scaling_method == 'standard':
+            scaler = StandardScaler()
+        else:
+            scaler = MinMaxScaler()
+            
+        scaler.fit(numerical_data.fillna(numerical_data.mean()).to_numpy())
+        
+        # Derived arrays first, the scaler entry marks the group as fitted
+        self._set_numerical_params(scaler)
+        self._scalers['numerical'] = scaler
+
+    def _dense_buffer(self, n_rows: int) -> np.ndarray:
+        """Per-thread float32 buffer view for the numerical and categorical blocks of a batch."""
+        dense_dim = len(self._numerical_features) + len(self._categorical_features)
+        buffer = getattr(self._scratch, 'dense', None)
+        if buffer is None or buffer.shape[0] < n_rows:
+            buffer = np.empty((max(n_rows, FEATURE_BUFFER_ROWS), dense_dim), dtype=np.float32)
+            self._scratch.dense = buffer
+            
+        return buffer[:n_rows]
+
+    def _set_numerical_params(self, scaler: Union[StandardScaler, MinMaxScaler]) -> None:
+        """Precompute imputation means and the fitted scaling as float32 per-column arrays."""
+        self._impute_means = np.array([
+            self._feature_stats['numerical'].get(column, {}).get('mean', 0.0)
+            for column in self._numerical_features
+        ], dtype=np.float32)
+        
+        # Express both scalers as value * scale + offset, derived in float64
+        if isinstance(scaler, StandardScaler):
+            scale = 1.0 / scaler.scale_
+            offset = -scaler.mean_ * scale
+        else:
+            scale = scaler.scale_
+            offset = scaler.min_
+            
+        self._num_scale = scale.astype(np.float32)
+        self._num_offset = offset.astype(np.float32)
+
+    def _fit_categorical(self, column: str, column_data: pd.Series) -> None:
+        """Fit the code map of a categorical column, folding rare values into 'Other'."""
+        # Handle rare categories
+        value_counts = column_data.value_counts()
+        rare_mask = value_counts < self._feature_config.get('min_category_frequency', 10)
+        rare_categories = value_counts[rare_mask].index
+        
+        # Replace rare categories with 'Other'
+        column_data = column_data.copy()
+        column_data[column_data.isin(rare_categories)] = OTHER_CATEGORY
+        
+        encoder = LabelEncoder().fit(column_data.dropna())
+        self._encoders[column] = encoder
+        
+        codes = {value: code for code, value in enumerate(encoder.classes_)}
+        codes.setdefault(OTHER_CATEGORY, len(codes))
+        
+        # Lookup first, the code map marks the column as fitted
+        self._set_category_lookup(column, codes)
+        self._category_codes[column] = codes
+
+    def _set_category_lookup(self, column: str, codes: Dict[Any, int]) -> None:
+        """Build the category index and int32 code array used by the batch path."""
+        lookup = np.empty(len(codes) + 1, dtype=np.int32)
+        lookup[:-1] = list(codes.values())
+        lookup[-1] = codes[OTHER_CATEGORY]
+        self._category_lookups[column] = (pd.Index(list(codes.keys())), lookup)
 
     def _validate_input_data(self, data: pd.DataFrame) -> None:
         """Validate input data structure and contents."""
@@ -266,21 +681,25 @@ class FeatureEngineer:
             raise ValueError(f"Missing required columns: {missing_columns}")
 
     def _generate_cache_key(self, data: pd.DataFrame) -> str:
-        """Generate unique cache key for input data."""
-        return joblib.hash(data)
-
-    def _process_feature_group(self, data: pd.DataFrame, feature_type: str) -> np.ndarray:
-        """Process a group of features based on their type."""
-        if feature_type == 'numerical':
-            return self.preprocess_numerical(data)
-        elif feature_type == 'categorical':
-            return self.preprocess_categorical(data)
-        else:
-            return self.preprocess_text(data)
+        """Generate unique cache key for input data from an xxh3 hash of its columns."""
+        hasher = xxhash.xxh3_64()
+        
+        for column, values in data.items():
+            hasher.update(str(column).encode())
+            array = values.to_numpy()
+            if array.dtype == object:
+                # Categorical and text columns hash their canonical repr
+                hasher.update(repr(array.tolist()).encode())
+            else:
+                # Numeric columns hash their raw buffer
+                hasher.update(array.dtype.str.encode())
+                hasher.update(np.ascontiguousarray(array).tobytes())
+                
+        return hasher.hexdigest()
 
     def _clean_text(self, text_series: pd.Series) -> pd.Series:
         """Clean and normalize text data."""
-        return text_series.fillna('').str.lower().str.replace(r'[^\w\s]', '')
+        return text_series.fillna('').map(_clean_value)
 
     def _track_numerical_stats(self, data: pd.DataFrame) -> None:
         """Track numerical feature statistics."""
@@ -300,6 +719,17 @@ class FeatureEngineer:
             if data[column].max() > self._feature_config.get('max_values', {}).get(column, float('inf')):
                 raise ValueError(f"Values above maximum threshold in column: {column}")
 
+    def _validate_numerical_row(self, values: np.ndarray) -> None:
+        """Validate one lead's numerical values against the configured bounds."""
+        below = values < self._num_min
+        if below.any():
+            column = self._numerical_features[below.argmax()]
+            raise ValueError(f"Values below minimum threshold in column: {column}")
+        above = values > self._num_max
+        if above.any():
+            column = self._numerical_features[above.argmax()]
+            raise ValueError(f"Values above maximum threshold in column: {column}")
+
     def _analyze_importance_trends(self, new_scores: Dict) -> None:
         """Analyze feature importance trends and trigger alerts if needed."""
         for feature, score in new_scores.items():
@@ -316,4 +746,55 @@ class FeatureEngineer:
     def _calculate_feature_importance(self, features: np.ndarray) -> Dict:
         """Calculate feature importance scores."""
         # Implementation would depend on the specific importance calculation method
-        return {}
\ No newline at end of file
+        return {}
+
+
+def _clean_value(value: Any) -> str:
+    """Lowercase a text value and strip punctuation, None becomes empty."""
+    if value is None:
+        return ''
+        
+    text = str(value).lower().translate(_ASCII_PUNCT_TABLE)
+    return text if text.isascii() else _CLEAN_RE.sub('', text)
+
+
+def _is_default_hashing(vectorizer: Any) -> bool:
+    """Whether a vectorizer is a HashingVectorizer with default word analysis."""
+    return (
+        isinstance(vectorizer, HashingVectorizer)
+        and vectorizer.analyzer == 'word'
+        and vectorizer.ngram_range == (1, 1)
+        and vectorizer.token_pattern == _TOKEN_RE.pattern
+        and vectorizer.tokenizer is None
+        and vectorizer.preprocessor is None
+        and vectorizer.stop_words is None
+        and vectorizer.strip_accents is None
+        and vectorizer.lowercase
+        and vectorizer.alternate_sign
+        and not vectorizer.binary
+        and vectorizer.norm == 'l2'
+    )
+
+
+def _hash_tokens(text: str, out: np.ndarray) -> None:
+    """
+    Hash lowercase text into out, matching a default HashingVectorizer row.
+
+    Args:
+        text (str): Lowercased text
+        out (np.ndarray): Row slice of width n_features, overwritten
+    """
+    n_features = out.shape[0]
+    out[:] = 0.0
+    
+    for token in _TOKEN_RE.findall(text):
+        h = murmurhash3_32(token, seed=0)
+        if h == _INT32_MIN:
+            index = (2147483647 - (n_features - 1)) % n_features
+        else:
+            index = abs(h) % n_features
+        out[index] += 1.0 if h >= 0 else -1.0
+        
+    norm = np.sqrt(np.dot(out, out))
+    if norm > 0:
+        out /= norm
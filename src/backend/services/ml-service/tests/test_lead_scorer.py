@@ -1,12 +1,33 @@
+import asyncio
+import threading
 import pytest
 import numpy as np
 import pandas as pd
+from scipy import sparse
+from types import SimpleNamespace
 from unittest.mock import Mock, patch
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+import time
 
+from ..src.models import lead_scorer, onnx_model
 from ..src.models.lead_scorer import LeadScorer
-from ..src.utils.feature_engineering import FeatureEngineer
-from ..src.config.model_config import ModelConfig
+from sklearn.feature_extraction.text import HashingVectorizer
+
+from ..src.utils.feature_engineering import (
+    FeatureEngineer,
+    TEXT_HASH_FEATURES,
+    _CLEAN_RE,
+    _clean_value,
+    _hash_tokens
+)
+from ..src.config.model_config import ModelConfig, load_config
+from ..src.services.scoring_service import MAX_BATCH_SIZE, ScoringService
+from ..src.utils.scoring_math import (
+    price_and_confidence,
+    batch_price_and_confidence,
+    finalize_score
+)
 
 # Test data constants
 TEST_DATA = {
@@ -55,6 +76,13 @@ EXPECTED_SCORES = {
     'life': 0.8
 }
 
+def fitted_engineer() -> FeatureEngineer:
+    """FeatureEngineer for the auto vertical fitted offline on repeated test leads."""
+    engineer = FeatureEngineer('auto', use_cache=False)
+    training_leads = [TEST_DATA['auto'], dict(TEST_DATA['auto'], age=45, vehicle_make='Honda')]
+    engineer.fit(pd.DataFrame(training_leads * 10))
+    return engineer
+
 @pytest.mark.usefixtures('test_env')
 class TestLeadScorer:
     """Comprehensive test suite for LeadScorer implementation."""
@@ -193,4 +221,410 @@ class TestLeadScorer:
         # Test model reload failure
         with patch('src.models.lead_scorer.joblib.load', side_effect=Exception('Model load failed')):
             with pytest.raises(ValueError):
-                scorer.reload_model()
\ No newline at end of file
+                scorer.reload_model()
+
+def stub_scorer(model: Mock) -> LeadScorer:
+    """LeadScorer for the auto vertical serving a stub model through fitted preprocessors."""
+    with patch.object(lead_scorer, 'FeatureEngineer', return_value=fitted_engineer()), \
+            patch.dict(lead_scorer.MODEL_CACHE, {'auto': (model, time.time())}):
+        return LeadScorer(vertical='auto')
+
+class TestLeadScorerBatching:
+    """Test suite for batched LeadScorer scoring against a stub model."""
+
+    def test_score_leads_batch(self):
+        """A batch is scored through one model prediction, results in input order."""
+        model = Mock()
+        model.params = {'version': '2.0'}
+        model.predict.side_effect = lambda features, num_threads: np.array([0.2, 0.9])
+        scorer = stub_scorer(model)
+        batch = [TEST_DATA['auto'], dict(TEST_DATA['auto'], age=45)]
+
+        results = scorer.score_leads(batch)
+
+        assert model.predict.call_count == 1
+        features = model.predict.call_args.args[0]
+        expected, _ = scorer._feature_engineer.transform_records(batch)
+        np.testing.assert_array_equal(features.toarray(), expected.toarray())
+
+        assert [result['score'] for result in results] == [0.2, 0.9]
+        assert results[0]['price'] < results[1]['price']
+        assert scorer.get_model_version() == '2.0'
+        assert scorer.score_leads([]) == []
+
+def mock_onnx_session(outputs, metadata=None) -> Mock:
+    """Stub onnxruntime module whose sessions return fixed outputs and metadata."""
+    session = Mock()
+    session.get_inputs.return_value = [SimpleNamespace(name='features')]
+    session.get_modelmeta.return_value.custom_metadata_map = metadata or {}
+    session.run.return_value = outputs
+    ort = Mock()
+    ort.InferenceSession.return_value = session
+    return ort
+
+class TestOnnxServing:
+    """Test suite for ONNX Runtime model serving."""
+
+    def test_onnx_model_path(self, tmp_path):
+        """Exports sit in a model directory or next to the serialized model."""
+        assert onnx_model.onnx_model_path(str(tmp_path)) == str(tmp_path / 'model.onnx')
+        assert onnx_model.onnx_model_path('/models/auto/model.joblib') == '/models/auto/model.onnx'
+
+    def test_classifier_predicts_positive_class(self):
+        """Classifier exports return the positive class probability per row and their metadata."""
+        labels = np.array([0, 1])
+        probabilities = np.array([[0.8, 0.2], [0.1, 0.9]], dtype=np.float32)
+        ort = mock_onnx_session([labels, probabilities], {'version': '3.1'})
+
+        with patch.object(onnx_model, 'ort', ort), patch.object(onnx_model, 'ONNX_AVAILABLE', True):
+            model = onnx_model.OnnxModel('model.onnx')
+        predictions = model.predict(np.ones((2, 3)), num_threads=4)
+
+        np.testing.assert_allclose(predictions, [0.2, 0.9])
+        inputs = ort.InferenceSession.return_value.run.call_args.args[1]['features']
+        assert inputs.dtype == np.float32 and inputs.flags.c_contiguous
+        assert model.params == {'version': '3.1'}
+
+    def test_regressor_predicts_single_column(self):
+        """Regressor exports return their single output column, sparse input is densified."""
+        ort = mock_onnx_session([np.array([[0.3], [0.7]], dtype=np.float32)])
+
+        with patch.object(onnx_model, 'ort', ort), patch.object(onnx_model, 'ONNX_AVAILABLE', True):
+            model = onnx_model.OnnxModel('model.onnx')
+        predictions = model.predict(sparse.csr_matrix(np.eye(2, 3)))
+
+        np.testing.assert_allclose(predictions, [0.3, 0.7])
+        assert predictions.shape == (2,)
+
+    def test_load_model_prefers_onnx_export(self, tmp_path):
+        """load_model serves the ONNX export when present and runtime is installed."""
+        (tmp_path / 'model.onnx').touch()
+        served = Mock()
+
+        with patch.object(lead_scorer, 'ONNX_AVAILABLE', True), \
+                patch.object(lead_scorer, 'OnnxModel', return_value=served) as onnx_cls, \
+                patch.dict(lead_scorer.MODEL_CACHE, clear=True):
+            assert lead_scorer.load_model('auto', str(tmp_path)) is served
+            assert lead_scorer.MODEL_CACHE['auto'][0] is served
+
+        onnx_cls.assert_called_once_with(
+            str(tmp_path / 'model.onnx'), num_threads=lead_scorer.PREDICT_NUM_THREADS
+        )
+
+    def test_load_model_without_export_uses_lightgbm(self, tmp_path):
+        """Without an export the LightGBM artifact is memory-mapped."""
+        booster = Mock(spec=lead_scorer.lgb.Booster)
+
+        with patch.object(lead_scorer, 'ONNX_AVAILABLE', True), \
+                patch.object(lead_scorer.joblib, 'load', return_value=booster) as load, \
+                patch.dict(lead_scorer.MODEL_CACHE, clear=True):
+            assert lead_scorer.load_model('auto', str(tmp_path / 'model.joblib')) is booster
+
+        load.assert_called_once_with(str(tmp_path / 'model.joblib'), mmap_mode='r')
+
+    def test_exported_model_matches_lightgbm(self, tmp_path):
+        """A real export served by ONNX Runtime matches LightGBM's predictions."""
+        pytest.importorskip('onnxruntime')
+        pytest.importorskip('onnxmltools')
+        lgb = lead_scorer.lgb
+
+        rng = np.random.default_rng(0)
+        features = rng.random((200, 5))
+        labels = (features[:, 0] + features[:, 1] > 1.0).astype(int)
+        booster = lgb.train(
+            {'objective': 'binary', 'verbose': -1},
+            lgb.Dataset(features, labels),
+            num_boost_round=10
+        )
+        booster.params['version'] = '4.2'
+
+        path = onnx_model.export_onnx_model(booster, 5, str(tmp_path / 'model.onnx'))
+        model = onnx_model.OnnxModel(path)
+
+        np.testing.assert_allclose(
+            model.predict(features), booster.predict(features), rtol=1e-4, atol=1e-5
+        )
+        assert model.params['version'] == '4.2'
+
+class TestFeatureEngineer:
+    """Test suite for FeatureEngineer input handling."""
+
+    def test_transform_records_checks_each_lead(self):
+        """A lead missing features is rejected even when batched with a complete lead."""
+        engineer = FeatureEngineer('auto')
+        incomplete = {key: value for key, value in TEST_DATA['auto'].items() if key != 'age'}
+
+        with pytest.raises(ValueError, match='age'):
+            engineer.transform_records([TEST_DATA['auto'], incomplete])
+
+    @pytest.mark.parametrize('text', [
+        'Software Engineer!',
+        "O'Brien & Sons, Inc. (est. 1990)",
+        '~`!@#$%^&*()-_=+[]{}|;:",.<>/?\\',
+        'Café Owner — São Paulo',
+        '¿Qué? ¡Sí! «quoted» “curly”',
+        'Mixed: naïve café, 50% off…',
+        '日本語、テキスト。',
+        ''
+    ])
+    def test_clean_value_matches_regex(self, text):
+        """The translate fast path matches the reference regex on ASCII and non-ASCII text."""
+        assert _clean_value(text) == _CLEAN_RE.sub('', text.lower())
+
+    @pytest.mark.parametrize('text', [
+        'software engineer',
+        'san francisco bay area area',
+        'a b c',
+        'café owner naïve',
+        '日本語 テキスト',
+        ''
+    ])
+    def test_hash_tokens_matches_hashing_vectorizer(self, text):
+        """Inline token hashing reproduces a default HashingVectorizer row."""
+        row = np.empty(TEXT_HASH_FEATURES, dtype=np.float32)
+        _hash_tokens(text, row)
+
+        expected = HashingVectorizer(n_features=TEXT_HASH_FEATURES).transform([text]).toarray()[0]
+        np.testing.assert_allclose(row, expected, rtol=1e-6, atol=1e-7)
+
+    @pytest.mark.parametrize('lead', [
+        TEST_DATA['auto'],
+        dict(TEST_DATA['auto'], age=45, vehicle_make='Honda'),
+        dict(TEST_DATA['auto'], vehicle_make='Unseen', occupation='Café owner, retired!'),
+        dict(TEST_DATA['auto'], annual_mileage=None, location=None)
+    ])
+    def test_transform_single_matches_batch_path(self, lead):
+        """The single-lead transform produces the batch path's feature row."""
+        engineer = fitted_engineer()
+
+        single, _ = engineer.transform_single(lead)
+        batch, _ = engineer.transform_records([lead])
+
+        np.testing.assert_allclose(single[0], batch.toarray()[0], rtol=1e-6, atol=1e-6)
+
+    def test_unfitted_preprocessors_are_not_fitted_on_traffic(self):
+        """Without fitted preprocessors transforms fail instead of fitting on live leads."""
+        engineer = FeatureEngineer('auto', use_cache=False)
+        assert not engineer.is_fitted
+
+        with pytest.raises(ValueError, match='not fitted'):
+            engineer.transform_records([TEST_DATA['auto']])
+        assert not engineer.is_fitted
+
+    def test_fit_offline(self):
+        """Offline fitting enables both transform paths."""
+        engineer = fitted_engineer()
+        assert engineer.is_fitted
+
+        features, _ = engineer.transform_records([TEST_DATA['auto']])
+        assert features.shape == (1, engineer.feature_dim)
+
+class StubPipeline:
+    """Scoring pipeline stub recording each batch, leads flagged 'bad' fail their batch."""
+
+    def __init__(self):
+        self.batches = []
+
+    def __call__(self, leads):
+        self.batches.append(list(leads))
+        if any(lead.get('bad') for lead in leads):
+            raise ValueError('bad lead')
+        return [{'score': lead['age'] / 100} for lead in leads]
+
+def stub_service(pipeline: StubPipeline) -> ScoringService:
+    """ScoringService for the auto vertical scoring through a stub pipeline."""
+    service = ScoringService()
+    service._scorers['auto'] = Mock(spec=LeadScorer)
+    service._pipelines['auto'] = pipeline
+    return service
+
+class TestScoringService:
+    """Test suite for ScoringService vertical handling and request batching."""
+
+    @pytest.mark.asyncio
+    async def test_unsupported_vertical_creates_no_state(self):
+        """Unknown verticals are rejected before any per-vertical state is created."""
+        service = ScoringService()
+
+        with pytest.raises(ValueError, match='Unsupported'):
+            await service.get_model_info('unknown')
+        with pytest.raises(ValueError, match='Unsupported'):
+            await service.score_lead('unknown', TEST_DATA['auto'])
+
+        assert not service._vertical_locks
+        assert not service._states
+        assert not service._batch_queues
+        await service.close()
+
+    @pytest.mark.asyncio
+    async def test_concurrent_leads_are_coalesced(self):
+        """Concurrent score_lead calls share one pipeline call and keep their own results."""
+        pipeline = StubPipeline()
+        service = stub_service(pipeline)
+
+        results = await asyncio.gather(*(
+            service.score_lead('auto', dict(TEST_DATA['auto'], age=age)) for age in (30, 40, 50)
+        ))
+
+        assert len(pipeline.batches) == 1
+        assert len(pipeline.batches[0]) == 3
+        assert [result['score'] for result in results] == [0.3, 0.4, 0.5]
+        await service.close()
+
+    @pytest.mark.asyncio
+    async def test_failed_batch_is_retried_per_lead(self):
+        """A failed batch is re-scored per lead and only per-lead failures are counted."""
+        pipeline = StubPipeline()
+        service = stub_service(pipeline)
+        leads = [TEST_DATA['auto']] + [dict(TEST_DATA['auto'], bad=True) for _ in range(4)]
+
+        results = await asyncio.gather(
+            *(service.score_lead('auto', lead) for lead in leads), return_exceptions=True
+        )
+
+        assert results[0]['score'] == 0.3
+        assert all(isinstance(result, ValueError) for result in results[1:])
+        assert [len(batch) for batch in pipeline.batches] == [5, 1, 1, 1, 1, 1]
+
+        # The batch attempt is not counted, four failures stay under the breaker threshold
+        state = service._state('auto')
+        assert state.error_count == 4
+        assert not state.circuit_open
+        await service.close()
+
+    @pytest.mark.asyncio
+    async def test_batches_score_concurrently(self):
+        """A full batch does not hold back the next one while a worker is free."""
+        # Each call waits for the other, serialized batches would break the barrier
+        barrier = threading.Barrier(2, timeout=5)
+        pipeline = StubPipeline()
+
+        def concurrent_pipeline(leads):
+            barrier.wait()
+            return pipeline(leads)
+
+        service = stub_service(concurrent_pipeline)
+        service._executor = ThreadPoolExecutor(max_workers=2)
+        service._batch_slots = asyncio.Semaphore(2)
+
+        results = await asyncio.gather(*(
+            service.score_lead('auto', TEST_DATA['auto']) for _ in range(MAX_BATCH_SIZE + 1)
+        ))
+
+        assert sorted(len(batch) for batch in pipeline.batches) == [1, MAX_BATCH_SIZE]
+        assert all(result['score'] == 0.3 for result in results)
+        await service.close()
+
+    @pytest.mark.asyncio
+    async def test_cancelled_caller_does_not_break_batch(self):
+        """A caller cancelled while queued leaves the batch and the drainer working."""
+        service = stub_service(StubPipeline())
+
+        cancelled = asyncio.create_task(service.score_lead('auto', TEST_DATA['auto']))
+        kept = asyncio.create_task(service.score_lead('auto', dict(TEST_DATA['auto'], age=40)))
+        await asyncio.sleep(0)
+        cancelled.cancel()
+
+        assert (await kept)['score'] == 0.4
+        assert cancelled.cancelled()
+        assert (await service.score_lead('auto', TEST_DATA['auto']))['score'] == 0.3
+        await service.close()
+
+class TestModelConfig:
+    """Test suite for ModelConfig configuration caching."""
+
+    def test_config_is_shared_across_instances(self):
+        """Identical configurations resolve to the same cached mapping."""
+        first = ModelConfig('auto')
+        second = ModelConfig('auto')
+
+        assert first._config is second._config
+
+        # Cached configuration is read-only
+        with pytest.raises(TypeError):
+            first._config['text_features'] = []
+
+    def test_override_bypasses_shared_config(self):
+        """Overrides produce a distinct cached configuration."""
+        override = {'text_features': ['occupation']}
+        config = ModelConfig('auto', config_override=override)
+
+        assert config._config is not ModelConfig('auto')._config
+        assert config._config['text_features'] == ['occupation']
+
+    def test_update_config_does_not_leak(self):
+        """Updating one instance leaves other instances untouched."""
+        config = ModelConfig('auto')
+        other = ModelConfig('auto')
+
+        config.update_config({'text_features': ['location']})
+
+        assert config._config['text_features'] == ['location']
+        assert other._config['text_features'] == ['occupation', 'location']
+
+    def test_load_config_is_memoized(self):
+        """load_config shares one instance per vertical until cleared."""
+        load_config.cache_clear()
+        config = load_config('auto')
+
+        assert load_config('auto') is config
+
+        load_config.cache_clear()
+        assert load_config('auto') is not config
+
+class TestScoringMath:
+    """Test suite for compiled scoring math kernels."""
+
+    @pytest.mark.parametrize('score,expected_confidence', [
+        (0.1, 0.9), (0.3, 0.8), (0.5, 0.7), (0.7, 0.8), (0.95, 0.9)
+    ])
+    def test_price_and_confidence(self, score, expected_confidence):
+        """Kernel matches the reference pricing and confidence rules."""
+        price, confidence = price_and_confidence(score, 1.2, 1.1, 1.0)
+
+        assert confidence == expected_confidence
+        assert price == pytest.approx(min(max((50 + score * 100) * 1.2 * 1.1, 25.0), 500.0))
+
+    def test_price_bounds(self):
+        """Prices are clamped to the $25-500 range."""
+        assert price_and_confidence(1.0, 2.0, 1.3, 1.1)[0] == pytest.approx(429.0)
+        assert price_and_confidence(1.0, 4.0, 1.3, 1.1)[0] == 500.0
+        assert price_and_confidence(0.0, 0.1, 1.0, 1.0)[0] == 25.0
+
+    @pytest.mark.parametrize('vertical_multiplier', [0.8, 1.0, 1.2, 1.5, 1.8, 2.0])
+    @pytest.mark.parametrize('market_multiplier', [0.9, 1.0, 1.2])
+    @pytest.mark.parametrize('seasonal_factor', [1.0, 1.1])
+    def test_batch_matches_scalar_kernel(
+        self, vertical_multiplier, market_multiplier, seasonal_factor
+    ):
+        """Vectorized pricing and confidence match the scalar kernel to the cent."""
+        scores = np.linspace(0.0, 1.0, 2001)
+        prices, confidences = batch_price_and_confidence(
+            scores, vertical_multiplier, market_multiplier, seasonal_factor
+        )
+
+        for score, price, confidence in zip(scores.tolist(), prices.tolist(), confidences.tolist()):
+            expected_price, expected_confidence = price_and_confidence(
+                score, vertical_multiplier, market_multiplier, seasonal_factor
+            )
+            assert round(price, 2) == round(expected_price, 2)
+            assert confidence == expected_confidence
+
+    def test_finalize_score_adjustments(self):
+        """Market multipliers apply only at high confidence and keep scores in [0, 1]."""
+        multipliers = np.array([1.1, 1.2])
+        no_importances = np.ones(0)
+
+        assert finalize_score(0.5, 0.9, multipliers, no_importances, 1.0)[0] == pytest.approx(0.66)
+        assert finalize_score(0.5, 0.7, multipliers, no_importances, 1.0)[0] == 0.5
+        assert finalize_score(0.9, 0.9, multipliers, no_importances, 1.0)[0] == 1.0
+        assert finalize_score(0.5, 0.9, np.ones(0), no_importances, 1.0)[0] == 0.5
+
+    def test_finalize_score_price(self):
+        """Prices apply the vertical multiplier and importance adjustment, rounded to cents."""
+        no_multipliers = np.ones(0)
+
+        assert finalize_score(0.5, 0.7, no_multipliers, np.ones(0), 1.2)[1] == 120.0
+        assert finalize_score(0.5, 0.7, no_multipliers, np.array([1.0, 1.0]), 1.0)[1] == 110.0
+        assert finalize_score(0.123, 0.7, no_multipliers, np.ones(0), 1.0)[1] == 62.3
+        assert finalize_score(1.0, 0.9, no_multipliers, np.ones(0), 5.0)[1] == 500.0